@@ -1,628 +1,507 @@
 """
-Student classes for University Management System
-Implements Student hierarchy with course enrollment and GPA tracking.
+Department classes for University Management System
+Implements department administration and cross-departmental registration.
 """
 
-from person import Person
-from datetime import datetime
+from student import Student, UndergraduateStudent, GraduateStudent
+from faculty import Faculty, Professor, Lecturer, TA
+from heapq import nlargest
+from operator import itemgetter
 from typing import List, Dict, Optional
+import logging
 
+logger = logging.getLogger(__name__)
 
-class Course:
+
+class Department:
     """
-    Represents a university course.
-    
+    Represents an academic department with faculty, students, and courses.
+
     Attributes:
-        course_code (str): Unique course identifier
-        course_name (str): Name of the course
-        credits (int): Number of credit hours
-        prerequisites (list): List of prerequisite course codes
-        max_enrollment (int): Maximum number of students
+        dept_code (str): Short department code (e.g., "CS")
+        dept_name (str): Full department name
+        head_of_department (Professor): Department head
     """
-    
-    def __init__(self, course_code, course_name, credits, prerequisites=None, max_enrollment=30):
-        """Initialize a Course object."""
-        self.course_code = course_code
-        self.course_name = course_name
-        self.credits = credits
-        self.prerequisites = prerequisites or []
-        self.max_enrollment = max_enrollment
-        self.enrolled_students = []
-        self.instructor = None
-    
-    def __str__(self):
-        return f"{self.course_code}: {self.course_name} ({self.credits} credits)"
 
+    __slots__ = ('_dept_code', '_dept_name', '_head', '_faculty', '_students',
+                 '_courses', '_registration_attempts', '_registration_successes')
 
-class Student(Person):
-    """
-    Base Student class with enrollment and GPA tracking capabilities.
-    
-    Attributes:
-        student_id (str): Unique student identifier
-        major (str): Student's major field of study
-        enrollment_date (datetime): Date of enrollment
-        enrolled_courses (dict): Dictionary of enrolled courses with grades
-        gpa_history (list): GPA history by semester
-        academic_status (str): Current academic standing
-    """
-    
-    def __init__(self, name, email, phone, major, **kwargs):
+    def __init__(self, dept_code, dept_name, head_of_department=None):
         """
-        Initialize a Student object.
-        
+        Initialize a Department object.
+
         Args:
-            name (str): Full name
-            email (str): Email address
-            phone (str): Phone number
-            major (str): Major field of study
-            **kwargs: Additional arguments for Person class
+            dept_code (str): Short department code
+            dept_name (str): Full department name
+            head_of_department (Professor, optional): Department head
         """
-        super().__init__(name, email, phone, **kwargs)
-        self._student_id = f"STU{self.person_id}"
-        self._major = self._validate_major(major)
-        self._enrollment_date = datetime.now()
-        self._enrolled_courses = {}  # {course_code: {'course': Course, 'grade': float, 'semester': str}}
-        self._gpa_history = []  # [{'semester': str, 'gpa': float, 'credits': int}]
-        self._academic_status = "Good Standing"
-        self._total_credits = 0
-    
-    # Properties with validation
+        if not dept_code or not isinstance(dept_code, str):
+            raise ValueError("Department code must be a non-empty string")
+        if not dept_name or not isinstance(dept_name, str):
+            raise ValueError("Department name must be a non-empty string")
+
+        self._dept_code = dept_code
+        self._dept_name = dept_name
+        self._head = head_of_department
+        # All membership containers are dicts keyed by id/code so every
+        # lookup on the registration paths is a single hash probe
+        self._faculty = {}  # {faculty_id: Faculty}
+        self._students = {}  # {student_id: Student}
+        self._courses = {}  # {course_code: Course}
+        self._registration_attempts = 0
+        self._registration_successes = 0
+
+        if head_of_department is not None:
+            self._faculty[head_of_department.faculty_id] = head_of_department
+
     @property
-    def student_id(self):
-        """Get student ID (read-only)."""
-        return self._student_id
-    
+    def dept_code(self):
+        """Get department code (read-only)."""
+        return self._dept_code
+
     @property
-    def major(self):
-        """Get major."""
-        return self._major
-    
-    @major.setter
-    def major(self, value):
-        """Set major with validation."""
-        self._major = self._validate_major(value)
-    
+    def dept_name(self):
+        """Get department name."""
+        return self._dept_name
+
     @property
-    def academic_status(self):
-        """Get academic status."""
-        return self._academic_status
-    
+    def head_of_department(self):
+        """Get department head."""
+        return self._head
+
     @property
-    def total_credits(self):
-        """Get total credits earned."""
-        return self._total_credits
-    
-    def _validate_major(self, major):
-        """Validate major input."""
-        if not major or not isinstance(major, str):
-            raise ValueError("Major must be a non-empty string")
-        return major.strip().title()
-    
-    def _validate_grade(self, grade):
-        """Validate grade input (0.0-4.0 scale)."""
-        try:
-            grade_float = float(grade)
-            if not 0.0 <= grade_float <= 4.0:
-                raise ValueError("Grade must be between 0.0 and 4.0")
-            return grade_float
-        except (TypeError, ValueError):
-            raise ValueError("Grade must be a valid number between 0.0 and 4.0")
-    
-    def enroll_course(self, course: Course, semester: str = None) -> bool:
+    def faculty_count(self):
+        """Get number of faculty members."""
+        return len(self._faculty)
+
+    @property
+    def student_count(self):
+        """Get number of enrolled students."""
+        return len(self._students)
+
+    @property
+    def course_count(self):
+        """Get number of offered courses."""
+        return len(self._courses)
+
+    @property
+    def students(self):
+        """Get the student mapping keyed by student_id."""
+        return self._students
+
+    @property
+    def courses(self):
+        """Get the course mapping keyed by course code."""
+        return self._courses
+
+    def add_faculty(self, faculty) -> bool:
         """
-        Enroll student in a course.
-        
+        Add a faculty member to the department.
+
         Args:
-            course (Course): Course object to enroll in
-            semester (str, optional): Semester identifier
-            
+            faculty: Faculty object to add
+
         Returns:
-            bool: True if enrollment successful, False otherwise
+            bool: True if addition successful
         """
-        try:
-            # Check if already enrolled
-            if course.course_code in self._enrolled_courses:
-                print(f"Already enrolled in {course.course_code}")
-                return False
-            
-            # Check enrollment limits
-            if len(course.enrolled_students) >= course.max_enrollment:
-                print(f"Course {course.course_code} is full")
-                return False
-            
-            # Check prerequisites
-            if not self._check_prerequisites(course.prerequisites):
-                print(f"Prerequisites not met for {course.course_code}")
-                return False
-            
-            # Enroll student
-            semester = semester or self._get_current_semester()
-            self._enrolled_courses[course.course_code] = {
-                'course': course,
-                'grade': None,
-                'semester': semester,
-                'status': 'Enrolled'
-            }
-            
-            course.enrolled_students.append(self.student_id)
-            print(f"Successfully enrolled in {course.course_code}")
-            return True
-            
-        except Exception as e:
-            print(f"Enrollment failed: {e}")
+        if faculty.faculty_id in self._faculty:
+            logger.debug("Faculty %s already in %s", faculty.faculty_id, self._dept_code)
             return False
-    
-    def drop_course(self, course_code: str) -> bool:
+
+        self._faculty[faculty.faculty_id] = faculty
+        return True
+
+    def add_student(self, student) -> bool:
         """
-        Drop a course.
-        
+        Add a student to the department.
+
         Args:
-            course_code (str): Code of the course to drop
-            
+            student: Student object to add
+
         Returns:
-            bool: True if drop successful, False otherwise
+            bool: True if addition successful
         """
-        try:
-            if course_code not in self._enrolled_courses:
-                print(f"Not enrolled in course {course_code}")
-                return False
-            
-            # Remove from enrolled courses
-            course = self._enrolled_courses[course_code]['course']
-            del self._enrolled_courses[course_code]
-            
-            # Remove from course enrollment list
-            if self.student_id in course.enrolled_students:
-                course.enrolled_students.remove(self.student_id)
-            
-            print(f"Successfully dropped {course_code}")
-            return True
-            
-        except Exception as e:
-            print(f"Drop failed: {e}")
+        if student.student_id in self._students:
+            logger.debug("Student %s already in %s", student.student_id, self._dept_code)
             return False
-    
-    def add_grade(self, course_code: str, grade: float) -> bool:
+
+        self._students[student.student_id] = student
+        return True
+
+    def add_course(self, course) -> bool:
         """
-        Add grade for a completed course.
-        
+        Add a course to the department catalog.
+
         Args:
-            course_code (str): Course code
-            grade (float): Grade on 4.0 scale
-            
+            course: Course object to add
+
         Returns:
-            bool: True if grade added successfully
+            bool: True if addition successful
         """
-        try:
-            if course_code not in self._enrolled_courses:
-                print(f"Not enrolled in course {course_code}")
-                return False
-            
-            validated_grade = self._validate_grade(grade)
-            self._enrolled_courses[course_code]['grade'] = validated_grade
-            self._enrolled_courses[course_code]['status'] = 'Completed'
-            
-            # Add credits to total
-            course = self._enrolled_courses[course_code]['course']
-            self._total_credits += course.credits
-            
-            print(f"Grade {validated_grade} added for {course_code}")
-            return True
-            
-        except Exception as e:
-            print(f"Adding grade failed: {e}")
+        if course.course_code in self._courses:
+            logger.debug("Course %s already in %s", course.course_code, self._dept_code)
             return False
-    
-    def calculate_gpa(self, semester: str = None) -> float:
+
+        self._courses[course.course_code] = course
+        return True
+
+    def get_course_by_code(self, course_code: str):
         """
-        Calculate GPA for a specific semester or overall.
-        
+        Look up a course by its code.
+
         Args:
-            semester (str, optional): Specific semester, None for overall GPA
-            
+            course_code (str): Course code to find
+
         Returns:
-            float: Calculated GPA
+            Course or None: The course if offered by this department
         """
-        total_points = 0.0
-        total_credits = 0
-        
-        for course_info in self._enrolled_courses.values():
-            # Filter by semester if specified
-            if semester and course_info['semester'] != semester:
-                continue
-            
-            # Only count courses with grades
-            if course_info['grade'] is not None:
-                credits = course_info['course'].credits
-                grade = course_info['grade']
-                total_points += grade * credits
-                total_credits += credits
-        
-        if total_credits == 0:
-            return 0.0
-        
-        gpa = round(total_points / total_credits, 2)
-        
-        # Update GPA history if calculating overall GPA
-        if semester is None:
-            self._update_gpa_history(gpa, total_credits)
-        
-        return gpa
-    
-    def get_academic_status(self) -> str:
+        return self._courses.get(course_code)
+
+    def get_faculty_by_id(self, faculty_id: str):
         """
-        Determine academic status based on GPA.
-        
+        Look up a faculty member by id.
+
+        Args:
+            faculty_id (str): Faculty id to find
+
         Returns:
-            str: Academic status
+            Faculty or None: The faculty member if in this department
         """
-        current_gpa = self.calculate_gpa()
-        
-        if current_gpa >= 3.5:
-            self._academic_status = "Dean's List"
-        elif current_gpa >= 2.0:
-            self._academic_status = "Good Standing"
-        elif current_gpa >= 1.0:
-            self._academic_status = "Academic Probation"
-        else:
-            self._academic_status = "Academic Suspension"
-        
-        return self._academic_status
-    
-    def _check_prerequisites(self, prerequisites: List[str]) -> bool:
-        """Check if student has completed prerequisites."""
-        if not prerequisites:
-            return True
-        
-        completed_courses = [
-            code for code, info in self._enrolled_courses.items()
-            if info['grade'] is not None and info['grade'] >= 2.0
-        ]
-        
-        return all(prereq in completed_courses for prereq in prerequisites)
-    
-    def _get_current_semester(self) -> str:
-        """Get current semester identifier."""
-        now = datetime.now()
-        year = now.year
-        if now.month >= 8:
-            return f"Fall {year}"
-        elif now.month >= 5:
-            return f"Summer {year}"
-        else:
-            return f"Spring {year}"
-    
-    def _update_gpa_history(self, gpa: float, credits: int):
-        """Update GPA history."""
-        current_semester = self._get_current_semester()
-        
-        # Update or add current semester GPA
-        for record in self._gpa_history:
-            if record['semester'] == current_semester:
-                record['gpa'] = gpa
-                record['credits'] = credits
-                return
-        
-        # Add new semester record
-        self._gpa_history.append({
-            'semester': current_semester,
-            'gpa': gpa,
-            'credits': credits
-        })
-    
-    def get_transcript(self) -> Dict:
-        """Get student transcript information."""
+        return self._faculty.get(faculty_id)
+
+    def assign_instructor(self, course_code: str, faculty_id: str) -> bool:
+        """
+        Assign a department faculty member to teach a course.
+
+        Args:
+            course_code (str): Course to assign
+            faculty_id (str): Faculty member to assign
+
+        Returns:
+            bool: True if assignment successful
+        """
+        course = self._courses.get(course_code)
+        if course is None:
+            logger.debug("No course %s in %s", course_code, self._dept_code)
+            return False
+
+        faculty = self._faculty.get(faculty_id)
+        if faculty is None:
+            logger.debug("No faculty %s in %s", faculty_id, self._dept_code)
+            return False
+
+        return faculty.assign_course(course)
+
+    def register_student_for_course(self, student_id: str, course_code: str,
+                                    semester: str = None) -> bool:
+        """
+        Register a department student for a department course.
+
+        Args:
+            student_id (str): Student to register
+            course_code (str): Course to register for
+            semester (str, optional): Semester for the registration
+
+        Returns:
+            bool: True if registration successful
+        """
+        self._registration_attempts += 1
+
+        student = self._students.get(student_id)
+        if student is None:
+            logger.debug("No student %s in %s", student_id, self._dept_code)
+            return False
+
+        course = self._courses.get(course_code)
+        if course is None:
+            logger.debug("No course %s in %s", course_code, self._dept_code)
+            return False
+
+        success = student.enroll_course(course, semester)
+        if success:
+            self._registration_successes += 1
+        return success
+
+    def get_enrollment_statistics(self) -> Dict:
+        """
+        Build department-wide enrollment statistics.
+
+        Returns:
+            dict: Department, faculty, student, and course statistics
+        """
+        professors = lecturers = tas = 0
+        for faculty in self._faculty.values():
+            if isinstance(faculty, Professor):
+                professors += 1
+            elif isinstance(faculty, Lecturer):
+                lecturers += 1
+            elif isinstance(faculty, TA):
+                tas += 1
+
+        undergraduate = graduate = 0
+        for student in self._students.values():
+            if isinstance(student, UndergraduateStudent):
+                undergraduate += 1
+            elif isinstance(student, GraduateStudent):
+                graduate += 1
+
+        courses_with_instructors = 0
+        total_enrollment = 0
+        for course in self._courses.values():
+            if course.instructor is not None:
+                courses_with_instructors += 1
+            total_enrollment += len(course.enrolled_students)
+
+        course_count = len(self._courses)
+        average_class_size = (round(total_enrollment / course_count, 2)
+                              if course_count else 0.0)
+
         return {
-            'student_info': self.get_basic_info(),
-            'major': self.major,
-            'total_credits': self.total_credits,
-            'current_gpa': self.calculate_gpa(),
-            'academic_status': self.get_academic_status(),
-            'courses': {
-                code: {
-                    'course_name': info['course'].course_name,
-                    'credits': info['course'].credits,
-                    'grade': info['grade'],
-                    'semester': info['semester'],
-                    'status': info['status']
-                }
-                for code, info in self._enrolled_courses.items()
+            'department_info': {
+                'code': self._dept_code,
+                'name': self._dept_name,
+                'head': self._head.name if self._head else "TBA"
+            },
+            'faculty_stats': {
+                'total_faculty': len(self._faculty),
+                'professors': professors,
+                'lecturers': lecturers,
+                'tas': tas
             },
-            'gpa_history': self._gpa_history
+            'student_stats': {
+                'total_students': len(self._students),
+                'undergraduate': undergraduate,
+                'graduate': graduate
+            },
+            'course_stats': {
+                'total_courses': course_count,
+                'courses_with_instructors': courses_with_instructors,
+                'total_enrollment': total_enrollment,
+                'average_class_size': average_class_size
+            }
         }
-    
-    def get_responsibilities(self):
-        """Get student responsibilities."""
+
+    def get_course_schedule(self) -> List[Dict]:
+        """
+        Build the course schedule table.
+
+        Returns:
+            list: One row dict per course with instructor and availability
+        """
         return [
-            "Attend classes regularly",
-            "Complete assignments and projects",
-            "Maintain academic standards",
-            "Follow university policies",
-            f"Complete degree requirements in {self.major}"
+            {
+                'course_code': course.course_code,
+                'course_name': course.course_name,
+                'instructor': course.instructor.name if course.instructor else "TBA",
+                'enrolled_students': len(course.enrolled_students),
+                'availability': course.max_enrollment - len(course.enrolled_students)
+            }
+            for course in self._courses.values()
         ]
-    
-    def get_role(self):
-        """Get role type."""
-        return "Student"
 
+    def get_faculty_workload_report(self) -> List[Dict]:
+        """
+        Build a workload report covering every faculty member.
 
-class UndergraduateStudent(Student):
-    """
-    Undergraduate student with specific requirements and limitations.
-    
-    Additional Attributes:
-        class_year (str): Freshman, Sophomore, Junior, Senior
-        max_credits_per_semester (int): Maximum credits allowed per semester
-        advisor (str): Academic advisor name
-    """
-    
-    def __init__(self, name, email, phone, major, class_year="Freshman", **kwargs):
-        """Initialize UndergraduateStudent."""
-        super().__init__(name, email, phone, major, **kwargs)
-        self._student_id = f"UG{self.person_id}"
-        self._class_year = class_year
-        self._max_credits_per_semester = 18
-        self._advisor = None
-        self._graduation_requirements = {
-            'min_credits': 120,
-            'min_gpa': 2.0,
-            'major_credits': 36
-        }
-    
-    @property
-    def class_year(self):
-        """Get class year."""
-        return self._class_year
-    
-    @class_year.setter
-    def class_year(self, value):
-        """Set class year with validation."""
-        valid_years = ["Freshman", "Sophomore", "Junior", "Senior"]
-        if value not in valid_years:
-            raise ValueError(f"Class year must be one of: {valid_years}")
-        self._class_year = value
-    
-    def calculate_workload(self) -> int:
-        """Calculate current semester workload."""
-        current_semester = self._get_current_semester()
-        credits = sum(
-            info['course'].credits
-            for info in self._enrolled_courses.values()
-            if info['semester'] == current_semester and info['status'] == 'Enrolled'
-        )
-        return credits
-    
-    def can_graduate(self) -> bool:
-        """Check if student meets graduation requirements."""
-        return (
-            self.total_credits >= self._graduation_requirements['min_credits'] and
-            self.calculate_gpa() >= self._graduation_requirements['min_gpa']
-        )
-    
-    def get_role(self):
-        """Get role type."""
-        return f"Undergraduate Student ({self.class_year})"
-
-
-class GraduateStudent(Student):
-    """
-    Graduate student with research focus and thesis requirements.
-    
-    Additional Attributes:
-        degree_type (str): Masters or PhD
-        thesis_advisor (str): Research advisor
-        thesis_topic (str): Research topic
-        committee_members (list): Thesis committee members
-    """
-    
-    def __init__(self, name, email, phone, major, degree_type="Masters", **kwargs):
-        """Initialize GraduateStudent."""
-        super().__init__(name, email, phone, major, **kwargs)
-        self._student_id = f"GR{self.person_id}"
-        self._degree_type = degree_type
-        self._thesis_advisor = None
-        self._thesis_topic = None
-        self._committee_members = []
-        self._research_credits = 0
-        
-        # Different requirements based on degree type
-        if degree_type == "PhD":
-            self._graduation_requirements = {
-                'min_credits': 72,
-                'min_gpa': 3.0,
-                'research_credits': 24
-            }
-        else:  # Masters
-            self._graduation_requirements = {
-                'min_credits': 36,
-                'min_gpa': 3.0,
-                'research_credits': 6
+        Returns:
+            list: One dict per faculty with name, role, and workload
+        """
+        return [
+            {
+                'name': faculty.name,
+                'role': faculty.get_role(),
+                'workload': faculty.calculate_workload()
             }
-    
-    @property
-    def degree_type(self):
-        """Get degree type."""
-        return self._degree_type
-    
-    @property
-    def thesis_advisor(self):
-        """Get thesis advisor."""
-        return self._thesis_advisor
-    
-    @thesis_advisor.setter
-    def thesis_advisor(self, advisor):
-        """Set thesis advisor."""
-        self._thesis_advisor = advisor
-    
-    def calculate_workload(self) -> Dict:
-        """Calculate graduate student workload including research."""
-        coursework_credits = sum(
-            info['course'].credits
-            for info in self._enrolled_courses.values()
-            if 'Research' not in info['course'].course_name
-        )
-        
-        research_credits = sum(
-            info['course'].credits
-            for info in self._enrolled_courses.values()
-            if 'Research' in info['course'].course_name
-        )
-        
-        return {
-            'coursework_credits': coursework_credits,
-            'research_credits': research_credits,
-            'total_credits': coursework_credits + research_credits
-        }
-    
-    def can_graduate(self) -> bool:
-        """Check if graduate student meets graduation requirements."""
-        workload = self.calculate_workload()
-        return (
-            self.total_credits >= self._graduation_requirements['min_credits'] and
-            self.calculate_gpa() >= self._graduation_requirements['min_gpa'] and
-            workload['research_credits'] >= self._graduation_requirements['research_credits']
-        )
-    
-    def get_role(self):
-        """Get role type."""
-        return f"Graduate Student ({self._degree_type})"
-    
-    def get_responsibilities(self):
-        """Get graduate student responsibilities."""
-        base_responsibilities = super().get_responsibilities()
-        grad_responsibilities = [
-            "Conduct original research",
-            "Work with thesis advisor",
-            "Present research findings",
-            "Complete thesis/dissertation"
+            for faculty in self._faculty.values()
         ]
-        return base_responsibilities + grad_responsibilities
+
+    def __str__(self):
+        return f"Department: {self._dept_name} ({self._dept_code})"
 
 
-class SecureStudentRecord:
+class CourseRegistrationSystem:
     """
-    Secure wrapper for student records with enhanced validation and access control.
-    
-    This class demonstrates encapsulation principles with strict data validation
-    and controlled access to student information.
+    Cross-departmental course registration system.
+
+    Maintains global student and course indexes over its member
+    departments so cross-registration is a pair of dict lookups rather
+    than a scan over departments.
     """
-    
-    def __init__(self, student: Student):
+
+    __slots__ = ('_departments', '_students_by_id', '_courses_by_code',
+                 '_registration_attempts', '_registration_successes')
+
+    def __init__(self):
+        """Initialize an empty registration system."""
+        self._departments = {}  # {dept_code: Department}
+        self._students_by_id = {}  # {student_id: Student}
+        self._courses_by_code = {}  # {course_code: (Department, Course)}
+        self._registration_attempts = 0
+        self._registration_successes = 0
+
+    def add_department(self, department) -> bool:
         """
-        Initialize secure student record.
-        
+        Add a department and index its students and courses.
+
         Args:
-            student (Student): Student object to secure
+            department: Department object to add
+
+        Returns:
+            bool: True if addition successful
+        """
+        if department.dept_code in self._departments:
+            logger.debug("Department %s already registered", department.dept_code)
+            return False
+
+        self._departments[department.dept_code] = department
+        self._index_department(department)
+        return True
+
+    def _index_department(self, department):
+        """Merge one department's students and courses into the global indexes."""
+        self._students_by_id.update(department.students)
+        self._courses_by_code.update(
+            (code, (department, course))
+            for code, course in department.courses.items())
+
+    def _reindex(self):
+        """Rebuild the global indexes from scratch.
+
+        Departments keep accepting students and courses after they join
+        the system; a lookup miss triggers this refresh so late additions
+        stay registrable without per-mutation notifications.
         """
-        if not isinstance(student, Student):
-            raise ValueError("Must provide a valid Student object")
-        
-        self._student = student
-        self._access_log = []
-        self._locked = False
-        self._max_enrollment_limit = 20
-    
-    def get_student_info(self, requester_id: str) -> Optional[Dict]:
+        self._students_by_id.clear()
+        self._courses_by_code.clear()
+        for department in self._departments.values():
+            self._index_department(department)
+
+    def cross_register_student(self, student_id: str, course_code: str,
+                               semester: str = None) -> bool:
         """
-        Get student information with access logging.
-        
+        Register any known student for any department's course.
+
         Args:
-            requester_id (str): ID of the person requesting information
-            
+            student_id (str): Student to register
+            course_code (str): Course to register for
+            semester (str, optional): Semester for the registration
+
         Returns:
-            Dict: Student information if authorized
+            bool: True if registration successful
         """
-        if self._locked:
-            raise PermissionError("Student record is locked")
-        
-        self._log_access(requester_id, "info_access")
-        return self._student.get_basic_info()
-    
-    def enroll_course_secure(self, course: Course, requester_id: str, semester: str = None) -> bool:
+        self._registration_attempts += 1
+
+        try:
+            student = self._students_by_id[student_id]
+            _, course = self._courses_by_code[course_code]
+        except KeyError:
+            # Late additions to member departments: refresh and retry once
+            self._reindex()
+            try:
+                student = self._students_by_id[student_id]
+                _, course = self._courses_by_code[course_code]
+            except KeyError:
+                logger.debug("Unknown student %s or course %s", student_id, course_code)
+                return False
+
+        success = student.enroll_course(course, semester)
+        if success:
+            self._registration_successes += 1
+        return success
+
+    def get_student_options(self, student_id: str) -> Dict:
         """
-        Secure course enrollment with additional validations.
-        
+        List courses with open seats the student is not yet taking.
+
         Args:
-            course (Course): Course to enroll in
-            requester_id (str): ID of person making the request
-            semester (str, optional): Semester for enrollment
-            
+            student_id (str): Student to look up
+
         Returns:
-            bool: True if enrollment successful
+            dict: {dept_code: {'department_name', 'courses': [...]}}
         """
-        try:
-            # Check enrollment limits
-            current_courses = len([
-                info for info in self._student._enrolled_courses.values()
-                if info['status'] == 'Enrolled'
-            ])
-            
-            if current_courses >= self._max_enrollment_limit:
-                raise ValueError(f"Cannot exceed {self._max_enrollment_limit} courses")
-            
-            # Check academic standing
-            if self._student.get_academic_status() == "Academic Suspension":
-                raise ValueError("Cannot enroll while on academic suspension")
-            
-            self._log_access(requester_id, f"course_enrollment_{course.course_code}")
-            return self._student.enroll_course(course, semester)
-            
-        except Exception as e:
-            self._log_access(requester_id, f"enrollment_failed_{e}")
-            print(f"Secure enrollment failed: {e}")
-            return False
-    
-    def update_gpa_secure(self, course_code: str, grade: float, requester_id: str) -> bool:
+        student = self._students_by_id.get(student_id)
+        if student is None:
+            self._reindex()
+            student = self._students_by_id.get(student_id)
+            if student is None:
+                return {}
+
+        enrolled_codes = set(student._enrolled_courses)
+
+        options = {}
+        for dept_code, department in self._departments.items():
+            available = []
+            for course in department.courses.values():
+                if course.course_code in enrolled_codes:
+                    continue
+                seats = course.max_enrollment - len(course.enrolled_students)
+                if seats > 0:
+                    available.append({
+                        'course_code': course.course_code,
+                        'course_name': course.course_name,
+                        'available_seats': seats
+                    })
+            if available:
+                options[dept_code] = {
+                    'department_name': department.dept_name,
+                    'courses': available
+                }
+        return options
+
+    def generate_system_report(self) -> Dict:
         """
-        Secure GPA update with validation.
-        
-        Args:
-            course_code (str): Course code
-            grade (float): Grade to assign
-            requester_id (str): ID of person making the request
-            
+        Build a system-wide overview, efficiency, and popularity report.
+
         Returns:
-            bool: True if update successful
+            dict: system_overview, system_efficiency, and popular_courses
         """
-        try:
-            # Additional validation for grade changes
-            if grade < 0.0 or grade > 4.0:
-                raise ValueError("Grade must be between 0.0 and 4.0")
-            
-            self._log_access(requester_id, f"grade_update_{course_code}_{grade}")
-            return self._student.add_grade(course_code, grade)
-            
-        except Exception as e:
-            self._log_access(requester_id, f"grade_update_failed_{e}")
-            print(f"Secure grade update failed: {e}")
-            return False
-    
-    def lock_record(self, requester_id: str):
-        """Lock the student record to prevent modifications."""
-        self._locked = True
-        self._log_access(requester_id, "record_locked")
-    
-    def unlock_record(self, requester_id: str):
-        """Unlock the student record."""
-        self._locked = False
-        self._log_access(requester_id, "record_unlocked")
-    
-    def _log_access(self, requester_id: str, action: str):
-        """Log access to student record."""
-        self._access_log.append({
-            'timestamp': datetime.now(),
-            'requester_id': requester_id,
-            'action': action,
-            'student_id': self._student.student_id
-        })
-    
-    def get_access_log(self, requester_id: str) -> List[Dict]:
-        """Get access log (administrative function)."""
-        self._log_access(requester_id, "access_log_viewed")
-        return self._access_log.copy()
-    
-    @property
-    def is_locked(self) -> bool:
-        """Check if record is locked."""
-        return self._locked
\ No newline at end of file
+        total_students = 0
+        total_courses = 0
+        total_enrollment = 0
+        total_capacity = 0
+        course_rows = []
+
+        for department in self._departments.values():
+            total_students += department.student_count
+            for course in department.courses.values():
+                total_courses += 1
+                enrolled = len(course.enrolled_students)
+                total_enrollment += enrolled
+                total_capacity += course.max_enrollment
+                course_rows.append({
+                    'course_code': course.course_code,
+                    'course_name': course.course_name,
+                    'enrolled_students': enrolled
+                })
+
+        attempts = self._registration_attempts
+        success_rate = (round(self._registration_successes / attempts * 100, 1)
+                        if attempts else 0.0)
+        average_class_size = (round(total_enrollment / total_courses, 2)
+                              if total_courses else 0.0)
+        course_utilization = (round(total_enrollment / total_capacity * 100, 1)
+                              if total_capacity else 0.0)
+
+        # Only the top courses are ever displayed; nlargest keeps a
+        # 5-element heap instead of sorting the whole catalog
+        popular_courses = nlargest(5, course_rows,
+                                   key=itemgetter('enrolled_students'))
+
+        return {
+            'system_overview': {
+                'total_departments': len(self._departments),
+                'total_students': total_students,
+                'total_courses': total_courses,
+                'total_registrations': total_enrollment
+            },
+            'system_efficiency': {
+                'registration_success_rate': success_rate,
+                'average_class_size': average_class_size,
+                'course_utilization': course_utilization
+            },
+            'popular_courses': popular_courses
+        }
+
+    def __str__(self):
+        return (f"CourseRegistrationSystem: {len(self._departments)} departments, "
+                f"{len(self._courses_by_code)} courses")
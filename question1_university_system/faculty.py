@@ -3,9 +3,188 @@ Faculty classes for University Management System
 Implements Faculty hierarchy with polymorphic behavior and workload calculation.
 """
 
-from person import Person
+from person import Person, _canon
+from dataclasses import dataclass, asdict
 from datetime import datetime
+from types import MappingProxyType
 from typing import List, Dict, Optional
+import logging
+import sys
+import time
+
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to the plain functions
+    njit = None
+
+logger = logging.getLogger(__name__)
+
+try:
+    import numpy as np
+except ImportError:  # numpy is optional for the bulk report path
+    np = None
+
+_VALID_DAYS = frozenset({
+    "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"
+})
+_VALID_CONTRACTS = frozenset({"Full-time", "Part-time", "Adjunct"})
+_VALID_TA_LEVELS = frozenset({"Undergraduate", "Masters", "PhD"})
+
+# Interned workload labels; compound literals are not auto-interned, and
+# these recur in every workload dict and report row
+_WL_BASE = sys.intern('Base Faculty')
+_WL_PROF = sys.intern('Professor')
+_WL_LECT = sys.intern('Lecturer')
+_WL_TA = sys.intern('Teaching Assistant')
+
+# Static responsibility text, shared across instances; only the
+# department line varies per faculty member
+_FACULTY_RESP_STATIC = (
+    "Teach assigned courses",
+    "Conduct research in field of expertise",
+    "Serve on university committees",
+    "Maintain office hours for students"
+)
+_PROF_RESP = (
+    "Lead research projects and secure funding",
+    "Supervise graduate students and postdocs",
+    "Publish research in peer-reviewed journals",
+    "Serve on university and professional committees",
+    "Mentor junior faculty members"
+)
+_LECT_RESP = (
+    "Focus primarily on teaching excellence",
+    "Develop and update course materials",
+    "Provide extensive student support and tutoring",
+    "Participate in curriculum development",
+    "Maintain industry connections and practical knowledge"
+)
+_TA_RESP_PRE = (
+    "Assist professors with course delivery",
+    "Grade assignments and exams",
+    "Conduct lab sessions and tutorials",
+    "Hold office hours for student support"
+)
+_TA_RESP_POST = ("Work under supervision of assigned professor",)
+
+def _prof_load(courses, grants, phd, committees):
+    """Professor load-point arithmetic (JIT-compiled when numba is present)."""
+    research_load = grants * 10 + phd * 5
+    service_load = committees * 3
+    return research_load, service_load, courses * 20 + research_load + service_load
+
+
+def _ta_load(assisting, grading, labs):
+    """TA load-point arithmetic (JIT-compiled when numba is present)."""
+    assistance_load = assisting * 10
+    grading_load = grading * 5
+    lab_load = labs * 3
+    return (assistance_load, grading_load, lab_load,
+            assistance_load + grading_load + lab_load)
+
+
+if njit is not None:
+    _prof_load = njit(cache=True)(_prof_load)
+    _ta_load = njit(cache=True)(_ta_load)
+
+
+# Slotted record types for the per-faculty event lists; far lighter than
+# the ad-hoc dicts they replace and immutable once stored
+@dataclass(slots=True, frozen=True)
+class Publication:
+    title: str
+    journal: str
+    year: int
+    date_added_ts: float
+
+
+@dataclass(slots=True, frozen=True)
+class Grant:
+    title: str
+    amount: float
+    funding_agency: str
+    date_awarded_ts: float
+
+
+@dataclass(slots=True, frozen=True)
+class Experience:
+    company: str
+    position: str
+    years: int
+    date_added_ts: float
+
+
+@dataclass(slots=True, frozen=True)
+class Evaluation:
+    course_code: str
+    rating: float
+    comments: str
+    semester: str
+    date_ts: float
+
+
+@dataclass(slots=True, frozen=True)
+class LabSession:
+    course_code: str
+    day: str
+    time: str
+    location: str
+    capacity: int = 25
+
+
+@dataclass(slots=True, frozen=True)
+class GradingDuty:
+    course_code: str
+    assignment_type: str
+    date_assigned_ts: float
+
+
+@dataclass(slots=True, frozen=True)
+class Assistance:
+    course: object
+    duties: List[str]
+    start_date_ts: float
+
+
+_year_cache = [0.0, 0]  # [expires_at, year]
+
+
+def _current_year() -> int:
+    """Return the current year, refreshed at most once per second."""
+    now = time.time()
+    if now >= _year_cache[0]:
+        _year_cache[0] = now + 1.0
+        _year_cache[1] = datetime.fromtimestamp(now).year
+    return _year_cache[1]
+
+
+def _ts_to_dt(ts: float) -> datetime:
+    """Convert a stored float timestamp back to datetime for display."""
+    return datetime.fromtimestamp(ts)
+
+
+_semester_cache = [0.0, '']  # [expires_at, label]
+
+
+def _current_semester() -> str:
+    """Current semester label, recomputed at most once per hour.
+
+    The label only changes at semester boundaries, so a short TTL keeps
+    bulk evaluation ingestion from hitting datetime.now() per record
+    while still rolling over without a restart.
+    """
+    now = time.time()
+    if now >= _semester_cache[0]:
+        dt = datetime.fromtimestamp(now)
+        if dt.month >= 8:
+            label = f"Fall {dt.year}"
+        elif dt.month >= 5:
+            label = f"Summer {dt.year}"
+        else:
+            label = f"Spring {dt.year}"
+        _semester_cache[0] = now + 3600.0
+        _semester_cache[1] = label
+    return _semester_cache[1]
 
 
 class Faculty(Person):
@@ -21,7 +200,15 @@ class Faculty(Person):
         courses_taught (list): List of courses currently teaching
         office_hours (dict): Office hours schedule
     """
-    
+
+    _ID_PREFIX = "FAC"
+
+    __slots__ = ('_faculty_id', '_department', '_hire_date', '_salary',
+                 '_office_location', '_courses_taught', '_office_hours',
+                 '_research_interests', '_publications', '_total_students',
+                 '_workload_cache', '_dept_line', '_resp_cache',
+                 '_courses_view')
+
     def __init__(self, name, email, phone, department, salary=50000.0, office_location="", **kwargs):
         """
         Initialize a Faculty object.
@@ -36,15 +223,20 @@ class Faculty(Person):
             **kwargs: Additional arguments for Person class
         """
         super().__init__(name, email, phone, **kwargs)
-        self._faculty_id = f"FAC{self.person_id}"
+        self._faculty_id = self._ID_PREFIX + self.person_id
         self._department = self._validate_department(department)
         self._hire_date = datetime.now()
         self._salary = self._validate_salary(salary)
         self._office_location = office_location
-        self._courses_taught = []
+        self._courses_taught = {}  # {course_code: Course}
+        self._courses_view = MappingProxyType(self._courses_taught)
         self._office_hours = {}  # {'day': ['time_start', 'time_end']}
         self._research_interests = []
         self._publications = []
+        self._total_students = 0  # live enrollment count across taught courses
+        self._workload_cache = None  # memoized calculate_workload result
+        self._resp_cache = None  # memoized get_responsibilities tuple
+        self._dept_line = f"Contribute to {self._department} department goals"
     
     # Properties with validation
     @property
@@ -61,6 +253,8 @@ class Faculty(Person):
     def department(self, value):
         """Set department with validation."""
         self._department = self._validate_department(value)
+        self._dept_line = f"Contribute to {self._department} department goals"
+        self._resp_cache = None
     
     @property
     def salary(self):
@@ -84,14 +278,18 @@ class Faculty(Person):
     
     @property
     def courses_taught(self):
-        """Get list of courses taught."""
-        return self._courses_taught.copy()
+        """Get a read-only, live view of courses taught (no copy)."""
+        return self._courses_view.values()
+
+    def get_courses_taught_list(self) -> List:
+        """Get an independent list copy of the courses taught."""
+        return list(self._courses_taught.values())
     
     def _validate_department(self, department):
         """Validate department input."""
         if not department or not isinstance(department, str):
             raise ValueError("Department must be a non-empty string")
-        return department.strip().title()
+        return sys.intern(_canon(department))
     
     def _validate_salary(self, salary):
         """Validate salary input."""
@@ -113,19 +311,16 @@ class Faculty(Person):
         Returns:
             bool: True if assignment successful
         """
-        try:
-            if course.course_code in [c.course_code for c in self._courses_taught]:
-                print(f"Already teaching {course.course_code}")
-                return False
-            
-            self._courses_taught.append(course)
-            course.instructor = self
-            print(f"Assigned to teach {course.course_code}")
-            return True
-            
-        except Exception as e:
-            print(f"Course assignment failed: {e}")
+        if course.course_code in self._courses_taught:
+            logger.debug("Already teaching %s", course.course_code)
             return False
+
+        self._courses_taught[course.course_code] = course
+        course.instructor = self
+        self._total_students += len(course.enrolled_students)
+        self._invalidate_workload()
+        logger.debug("Assigned to teach %s", course.course_code)
+        return True
     
     def remove_course(self, course_code: str) -> bool:
         """
@@ -137,20 +332,16 @@ class Faculty(Person):
         Returns:
             bool: True if removal successful
         """
-        try:
-            for course in self._courses_taught:
-                if course.course_code == course_code:
-                    self._courses_taught.remove(course)
-                    course.instructor = None
-                    print(f"Removed from teaching {course_code}")
-                    return True
-            
-            print(f"Not currently teaching {course_code}")
-            return False
-            
-        except Exception as e:
-            print(f"Course removal failed: {e}")
+        course = self._courses_taught.pop(course_code, None)
+        if course is None:
+            logger.debug("Not currently teaching %s", course_code)
             return False
+
+        course.instructor = None
+        self._total_students -= len(course.enrolled_students)
+        self._invalidate_workload()
+        logger.debug("Removed from teaching %s", course_code)
+        return True
     
     def set_office_hours(self, day: str, start_time: str, end_time: str):
         """
@@ -161,11 +352,11 @@ class Faculty(Person):
             start_time (str): Start time (e.g., "10:00 AM")
             end_time (str): End time (e.g., "12:00 PM")
         """
-        valid_days = ["Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday", "Sunday"]
-        if day.title() not in valid_days:
-            raise ValueError(f"Day must be one of: {valid_days}")
-        
-        self._office_hours[day.title()] = {'start': start_time, 'end': end_time}
+        day_title = sys.intern(day.title())
+        if day_title not in _VALID_DAYS:
+            raise ValueError(f"Day must be one of: {sorted(_VALID_DAYS)}")
+
+        self._office_hours[day_title] = {'start': start_time, 'end': end_time}
     
     def add_research_interest(self, interest: str):
         """Add a research interest."""
@@ -174,32 +365,80 @@ class Faculty(Person):
     
     def add_publication(self, title: str, journal: str = "", year: int = None):
         """Add a publication."""
-        publication = {
-            'title': title,
-            'journal': journal,
-            'year': year or datetime.now().year,
-            'date_added': datetime.now()
-        }
-        self._publications.append(publication)
+        self._publications.append(
+            Publication(title, journal, year or _current_year(), time.time()))
+
+    @staticmethod
+    def bulk_workload_report(faculty_list):
+        """Compute load points for many faculty in one vectorized pass.
+
+        Extracts the duty counts into parallel NumPy arrays and evaluates
+        the load-point formula as a single array expression, avoiding a
+        per-faculty calculate_workload call when ranking a whole
+        department.
+
+        Args:
+            faculty_list (list): Faculty instances of any subclass
+
+        Returns:
+            numpy.recarray: fields courses, grants, phd_students,
+                committees, total_load_points (one row per faculty)
+        """
+        if np is None:
+            raise ImportError("numpy is required for bulk_workload_report")
+
+        n = len(faculty_list)
+        courses = np.fromiter((len(f._courses_taught) for f in faculty_list),
+                              dtype=np.int32, count=n)
+        grants = np.fromiter(
+            (len(getattr(f, '_research_grants', ())) for f in faculty_list),
+            dtype=np.int32, count=n)
+        phd = np.fromiter(
+            (len(getattr(f, '_phd_students', ())) for f in faculty_list),
+            dtype=np.int32, count=n)
+        committees = np.fromiter(
+            (len(getattr(f, '_committees', ())) for f in faculty_list),
+            dtype=np.int32, count=n)
+
+        total = courses * 20 + grants * 10 + phd * 5 + committees * 3
+        return np.rec.fromarrays(
+            [courses, grants, phd, committees, total],
+            names=('courses', 'grants', 'phd_students', 'committees',
+                   'total_load_points'))
 
-    # Abstract methods to be overridden by subclasses
     def calculate_workload(self) -> Dict:
-        """Calculate faculty workload (to be overridden)."""
+        """Calculate faculty workload, serving the cached result when clean."""
+        if self._workload_cache is None:
+            self._workload_cache = self._compute_workload()
+        return self._workload_cache
+
+    def _invalidate_workload(self):
+        """Drop the cached workload after a mutation."""
+        self._workload_cache = None
+
+    def on_enrollment_change(self, delta: int):
+        """Adjust the live student count when a taught course's enrollment changes."""
+        self._total_students += delta
+        self._workload_cache = None
+
+    # To be overridden by subclasses
+    def _compute_workload(self) -> Dict:
+        """Compute faculty workload (to be overridden)."""
         return {
             'courses': len(self._courses_taught),
-            'total_students': sum(len(course.enrolled_students) for course in self._courses_taught),
-            'workload_type': 'Base Faculty'
+            'total_students': self._total_students,
+            'workload_type': _WL_BASE
         }
     
     def get_responsibilities(self):
-        """Get faculty responsibilities."""
-        return [
-            "Teach assigned courses",
-            "Conduct research in field of expertise",
-            "Serve on university committees",
-            "Maintain office hours for students",
-            f"Contribute to {self.department} department goals"
-        ]
+        """Get faculty responsibilities (cached until the department changes)."""
+        if self._resp_cache is None:
+            self._resp_cache = tuple(self._build_responsibilities())
+        return self._resp_cache
+
+    def _build_responsibilities(self):
+        """Build the responsibility list (overridden by subclasses)."""
+        return list(_FACULTY_RESP_STATIC) + [self._dept_line]
     
     def get_role(self):
         """Get role type."""
@@ -214,7 +453,7 @@ class Faculty(Person):
             'salary': self.salary,
             'office_location': self.office_location,
             'hire_date': self._hire_date.strftime('%Y-%m-%d'),
-            'courses_taught': [course.course_code for course in self._courses_taught],
+            'courses_taught': list(self._courses_taught),
             'office_hours': self._office_hours,
             'research_interests': self._research_interests,
             'publications_count': len(self._publications),
@@ -232,17 +471,23 @@ class Professor(Faculty):
         phd_students (list): PhD students being supervised
         committees (list): University committees served on
     """
-    
+
+    _ID_PREFIX = "PROF"
+
+    __slots__ = ('_tenure_status', '_research_grants', '_phd_students',
+                 '_committees', '_max_courses_per_semester',
+                 '_administrative_role', '_role')
+
     def __init__(self, name, email, phone, department, salary=80000.0, tenure_status=False, **kwargs):
         """Initialize Professor."""
         super().__init__(name, email, phone, department, salary, **kwargs)
-        self._faculty_id = f"PROF{self.person_id}"
         self._tenure_status = tenure_status
         self._research_grants = []
         self._phd_students = []
         self._committees = []
         self._max_courses_per_semester = 2  # Professors typically teach fewer courses
         self._administrative_role = None
+        self._role = f"Professor ({'Tenured' if tenure_status else 'Non-Tenured'})"
     
     @property
     def tenure_status(self):
@@ -255,62 +500,70 @@ class Professor(Faculty):
         if not isinstance(value, bool):
             raise ValueError("Tenure status must be boolean")
         self._tenure_status = value
+        self._role = f"Professor ({'Tenured' if value else 'Non-Tenured'})"
     
     def add_research_grant(self, title: str, amount: float, funding_agency: str):
         """Add a research grant."""
-        grant = {
-            'title': title,
-            'amount': amount,
-            'funding_agency': funding_agency,
-            'date_awarded': datetime.now()
-        }
-        self._research_grants.append(grant)
+        self._research_grants.append(
+            Grant(title, amount, funding_agency, time.time()))
+        self._invalidate_workload()
     
     def supervise_phd_student(self, student_id: str):
         """Add a PhD student to supervision list."""
         if student_id not in self._phd_students:
             self._phd_students.append(student_id)
+            self._invalidate_workload()
     
     def join_committee(self, committee_name: str):
         """Join a university committee."""
         if committee_name not in self._committees:
             self._committees.append(committee_name)
+            self._invalidate_workload()
     
-    def calculate_workload(self) -> Dict:
-        """Calculate professor workload including research and service."""
-        base_workload = super().calculate_workload()
+    def _compute_workload(self) -> Dict:
+        """Compute professor workload including research and service."""
+        workload = super()._compute_workload()
         
         # Professors have research and service responsibilities
-        research_load = len(self._research_grants) * 10 + len(self._phd_students) * 5
-        service_load = len(self._committees) * 3
+        research_load, service_load, total_load = _prof_load(
+            workload['courses'], len(self._research_grants),
+            len(self._phd_students), len(self._committees))
         
-        return {
-            **base_workload,
-            'research_grants': len(self._research_grants),
-            'phd_students': len(self._phd_students),
-            'committees': len(self._committees),
-            'research_load_points': research_load,
-            'service_load_points': service_load,
-            'total_load_points': base_workload['courses'] * 20 + research_load + service_load,
-            'workload_type': 'Professor'
-        }
-    
-    def get_responsibilities(self):
-        """Get professor-specific responsibilities."""
-        base_responsibilities = super().get_responsibilities()
-        prof_responsibilities = [
-            "Lead research projects and secure funding",
-            "Supervise graduate students and postdocs",
-            "Publish research in peer-reviewed journals",
-            "Serve on university and professional committees",
-            "Mentor junior faculty members"
-        ]
-        return base_responsibilities + prof_responsibilities
+        workload.update(
+            research_grants=len(self._research_grants),
+            phd_students=len(self._phd_students),
+            committees=len(self._committees),
+            research_load_points=research_load,
+            service_load_points=service_load,
+            total_load_points=total_load,
+            workload_type=_WL_PROF
+        )
+        return workload
+    
+    def _build_responsibilities(self):
+        """Build professor-specific responsibilities."""
+        return super()._build_responsibilities() + list(_PROF_RESP)
     
     def get_role(self):
         """Get role type."""
-        tenure_str = "Tenured" if self._tenure_status else "Non-Tenured"
-        return f"Professor ({tenure_str})"
+        return self._role
+    
+    def get_research_info(self) -> Dict:
+        """Get professor research information."""
+        return {
+            'publications': [
+                {**asdict(pub),
+                 'date_added': _ts_to_dt(pub.date_added_ts).strftime('%Y-%m-%d')}
+                for pub in self._publications
+            ],
+            'research_grants': [
+                {**asdict(grant),
+                 'date_awarded': _ts_to_dt(grant.date_awarded_ts).strftime('%Y-%m-%d')}
+                for grant in self._research_grants
+            ],
+            'phd_students': list(self._phd_students),
+            'committees': list(self._committees)
+        }
 
 
 class Lecturer(Faculty):
@@ -322,15 +575,23 @@ class Lecturer(Faculty):
         teaching_load (int): Number of courses per semester
         professional_experience (list): Industry experience
     """
-    
+
+    _ID_PREFIX = "LECT"
+
+    __slots__ = ('_contract_type', '_teaching_load', '_professional_experience',
+                 '_student_evaluations', '_eval_sum', '_eval_count',
+                 '_max_courses_per_semester', '_role')
+
     def __init__(self, name, email, phone, department, contract_type="Full-time", salary=55000.0, **kwargs):
         """Initialize Lecturer."""
         super().__init__(name, email, phone, department, salary, **kwargs)
-        self._faculty_id = f"LECT{self.person_id}"
         self._contract_type = self._validate_contract_type(contract_type)
         self._teaching_load = 4 if contract_type == "Full-time" else 2
         self._professional_experience = []
         self._student_evaluations = []
+        self._eval_sum = 0.0
+        self._eval_count = 0
+        self._role = f"Lecturer ({self._contract_type})"
         
         # Set course limits based on contract type
         if contract_type == "Full-time":
@@ -352,86 +613,62 @@ class Lecturer(Faculty):
     
     def _validate_contract_type(self, contract_type):
         """Validate contract type."""
-        valid_types = ["Full-time", "Part-time", "Adjunct"]
-        if contract_type not in valid_types:
-            raise ValueError(f"Contract type must be one of: {valid_types}")
-        return contract_type
+        if contract_type not in _VALID_CONTRACTS:
+            raise ValueError(f"Contract type must be one of: {sorted(_VALID_CONTRACTS)}")
+        return sys.intern(contract_type)
     
     def add_professional_experience(self, company: str, position: str, years: int):
         """Add professional experience."""
-        experience = {
-            'company': company,
-            'position': position,
-            'years': years,
-            'date_added': datetime.now()
-        }
-        self._professional_experience.append(experience)
+        self._professional_experience.append(
+            Experience(company, position, years, time.time()))
     
     def add_student_evaluation(self, course_code: str, rating: float, comments: str = ""):
         """Add student evaluation."""
         if not 1.0 <= rating <= 5.0:
             raise ValueError("Rating must be between 1.0 and 5.0")
         
-        evaluation = {
-            'course_code': course_code,
-            'rating': rating,
-            'comments': comments,
-            'semester': self._get_current_semester(),
-            'date': datetime.now()
-        }
-        self._student_evaluations.append(evaluation)
+        self._student_evaluations.append(
+            Evaluation(course_code, rating, comments,
+                       self._get_current_semester(), time.time()))
+        self._eval_sum += rating
+        self._eval_count += 1
+        self._invalidate_workload()
     
     def get_average_evaluation(self) -> float:
         """Get average student evaluation rating."""
-        if not self._student_evaluations:
+        if not self._eval_count:
             return 0.0
-        
-        total_rating = sum(eval['rating'] for eval in self._student_evaluations)
-        return round(total_rating / len(self._student_evaluations), 2)
+
+        return round(self._eval_sum / self._eval_count, 2)
     
-    def calculate_workload(self) -> Dict:
-        """Calculate lecturer workload focused on teaching."""
-        base_workload = super().calculate_workload()
+    def _compute_workload(self) -> Dict:
+        """Compute lecturer workload focused on teaching."""
+        workload = super()._compute_workload()
         
         # Lecturers have heavier teaching loads
-        teaching_intensity = sum(len(course.enrolled_students) for course in self._courses_taught)
+        teaching_intensity = self._total_students
         
-        return {
-            **base_workload,
-            'contract_type': self._contract_type,
-            'teaching_load': self._teaching_load,
-            'teaching_intensity': teaching_intensity,
-            'average_evaluation': self.get_average_evaluation(),
-            'total_evaluations': len(self._student_evaluations),
-            'workload_type': 'Lecturer'
-        }
+        workload.update(
+            contract_type=self._contract_type,
+            teaching_load=self._teaching_load,
+            teaching_intensity=teaching_intensity,
+            average_evaluation=self.get_average_evaluation(),
+            total_evaluations=len(self._student_evaluations),
+            workload_type=_WL_LECT
+        )
+        return workload
     
     def _get_current_semester(self) -> str:
         """Get current semester identifier."""
-        now = datetime.now()
-        year = now.year
-        if now.month >= 8:
-            return f"Fall {year}"
-        elif now.month >= 5:
-            return f"Summer {year}"
-        else:
-            return f"Spring {year}"
+        return _current_semester()
     
-    def get_responsibilities(self):
-        """Get lecturer-specific responsibilities."""
-        base_responsibilities = super().get_responsibilities()
-        lecturer_responsibilities = [
-            "Focus primarily on teaching excellence",
-            "Develop and update course materials",
-            "Provide extensive student support and tutoring",
-            "Participate in curriculum development",
-            "Maintain industry connections and practical knowledge"
-        ]
-        return base_responsibilities + lecturer_responsibilities
+    def _build_responsibilities(self):
+        """Build lecturer-specific responsibilities."""
+        return super()._build_responsibilities() + list(_LECT_RESP)
     
     def get_role(self):
         """Get role type."""
-        return f"Lecturer ({self._contract_type})"
+        return self._role
 
 
 class TA(Faculty):
@@ -444,18 +681,25 @@ class TA(Faculty):
         ta_level (str): Undergraduate, Masters, or PhD level TA
         courses_assisting (list): Courses they assist with
     """
-    
+
+    _ID_PREFIX = "TA"
+
+    __slots__ = ('_student_status', '_supervising_professor', '_ta_level',
+                 '_courses_assisting', '_assisting_codes', '_grading_duties',
+                 '_lab_sessions', '_max_courses_per_semester', '_role')
+
     def __init__(self, name, email, phone, department, ta_level="Masters", salary=20000.0, **kwargs):
         """Initialize Teaching Assistant."""
         super().__init__(name, email, phone, department, salary, **kwargs)
-        self._faculty_id = f"TA{self.person_id}"
         self._student_status = True
         self._supervising_professor = None
         self._ta_level = self._validate_ta_level(ta_level)
         self._courses_assisting = []  # Different from courses_taught
+        self._assisting_codes = set()  # hashed membership for assist_course
         self._grading_duties = []
         self._lab_sessions = []
         self._max_courses_per_semester = 2
+        self._role = f"Teaching Assistant ({self._ta_level})"
     
     @property
     def ta_level(self):
@@ -474,10 +718,9 @@ class TA(Faculty):
     
     def _validate_ta_level(self, level):
         """Validate TA level."""
-        valid_levels = ["Undergraduate", "Masters", "PhD"]
-        if level not in valid_levels:
-            raise ValueError(f"TA level must be one of: {valid_levels}")
-        return level
+        if level not in _VALID_TA_LEVELS:
+            raise ValueError(f"TA level must be one of: {sorted(_VALID_TA_LEVELS)}")
+        return sys.intern(level)
     
     def assist_course(self, course, duties: List[str] = None):
         """
@@ -487,73 +730,58 @@ class TA(Faculty):
             course: Course object to assist with
             duties (list, optional): List of specific duties
         """
-        if course.course_code not in [c.course_code for c in self._courses_assisting]:
-            assistance = {
-                'course': course,
-                'duties': duties or ['Grading', 'Lab supervision', 'Office hours'],
-                'start_date': datetime.now()
-            }
+        if course.course_code not in self._assisting_codes:
+            assistance = Assistance(
+                course, duties or ['Grading', 'Lab supervision', 'Office hours'],
+                time.time())
             self._courses_assisting.append(assistance)
-            print(f"Now assisting with {course.course_code}")
+            self._assisting_codes.add(course.course_code)
+            self._invalidate_workload()
+            logger.debug("Now assisting with %s", course.course_code)
     
     def add_grading_duty(self, course_code: str, assignment_type: str):
         """Add grading responsibility."""
-        duty = {
-            'course_code': course_code,
-            'assignment_type': assignment_type,
-            'date_assigned': datetime.now()
-        }
-        self._grading_duties.append(duty)
+        self._grading_duties.append(
+            GradingDuty(course_code, assignment_type, time.time()))
+        self._invalidate_workload()
     
     def schedule_lab_session(self, course_code: str, day: str, time: str, location: str):
         """Schedule a lab session."""
-        lab_session = {
-            'course_code': course_code,
-            'day': day,
-            'time': time,
-            'location': location,
-            'capacity': 25
-        }
-        self._lab_sessions.append(lab_session)
+        self._lab_sessions.append(
+            LabSession(course_code, day, time, location))
+        self._invalidate_workload()
     
-    def calculate_workload(self) -> Dict:
-        """Calculate TA workload including assistance and grading."""
-        base_workload = super().calculate_workload()
+    def _compute_workload(self) -> Dict:
+        """Compute TA workload including assistance and grading."""
+        workload = super()._compute_workload()
         
         # TAs have different workload calculations
-        assistance_load = len(self._courses_assisting) * 10
-        grading_load = len(self._grading_duties) * 5
-        lab_load = len(self._lab_sessions) * 3
+        assistance_load, grading_load, lab_load, total_load = _ta_load(
+            len(self._courses_assisting), len(self._grading_duties),
+            len(self._lab_sessions))
         
-        return {
-            **base_workload,
-            'ta_level': self._ta_level,
-            'courses_assisting': len(self._courses_assisting),
-            'grading_duties': len(self._grading_duties),
-            'lab_sessions': len(self._lab_sessions),
-            'assistance_load_points': assistance_load,
-            'grading_load_points': grading_load,
-            'lab_load_points': lab_load,
-            'total_load_points': assistance_load + grading_load + lab_load,
-            'workload_type': 'Teaching Assistant'
-        }
-    
-    def get_responsibilities(self):
-        """Get TA-specific responsibilities."""
-        base_responsibilities = super().get_responsibilities()
-        ta_responsibilities = [
-            "Assist professors with course delivery",
-            "Grade assignments and exams",
-            "Conduct lab sessions and tutorials",
-            "Hold office hours for student support",
-            f"Balance TA duties with {self._ta_level} studies",
-            "Work under supervision of assigned professor"
-        ]
-        return base_responsibilities + ta_responsibilities
+        workload.update(
+            ta_level=self._ta_level,
+            courses_assisting=len(self._courses_assisting),
+            grading_duties=len(self._grading_duties),
+            lab_sessions=len(self._lab_sessions),
+            assistance_load_points=assistance_load,
+            grading_load_points=grading_load,
+            lab_load_points=lab_load,
+            total_load_points=total_load,
+            workload_type=_WL_TA
+        )
+        return workload
+    
+    def _build_responsibilities(self):
+        """Build TA-specific responsibilities."""
+        return (super()._build_responsibilities() + list(_TA_RESP_PRE) +
+                [f"Balance TA duties with {self._ta_level} studies"] +
+                list(_TA_RESP_POST))
     
     def get_role(self):
         """Get role type."""
-        return f"Teaching Assistant ({self._ta_level})"
+        return self._role
     
     def get_ta_info(self) -> Dict:
         """Get TA-specific information."""
@@ -563,13 +791,40 @@ class TA(Faculty):
             'supervising_professor': self._supervising_professor,
             'courses_assisting': [
                 {
-                    'course_code': assist['course'].course_code,
-                    'duties': assist['duties']
+                    'course_code': assist.course.course_code,
+                    'duties': assist.duties
                 }
                 for assist in self._courses_assisting
             ],
-            'lab_sessions': self._lab_sessions,
+            'lab_sessions': [asdict(session) for session in self._lab_sessions],
             'grading_duties_count': len(self._grading_duties)
         }
         
-        return {**base_info, **ta_specific}
\ No newline at end of file
+        return {**base_info, **ta_specific}
+
+# Type-tagged dispatch for bulk workload reports: one dict lookup and a
+# plain function call per faculty, skipping MRO resolution and
+# bound-method allocation at this highly polymorphic call site
+_WORKLOAD_FN = {
+    Faculty: Faculty._compute_workload,
+    Professor: Professor._compute_workload,
+    Lecturer: Lecturer._compute_workload,
+    TA: TA._compute_workload,
+}
+
+
+def bulk_workloads(faculty_list) -> List[Dict]:
+    """Compute fresh workload dicts for a heterogeneous faculty list.
+
+    Single-instance callers should keep using calculate_workload, which
+    also serves the per-instance cache; this path trades the cache for
+    cheap dispatch across large report loops.
+
+    Args:
+        faculty_list (list): Faculty instances of any subclass
+
+    Returns:
+        list: one workload dict per faculty, in input order
+    """
+    fns = _WORKLOAD_FN
+    return [fns.get(type(f), type(f)._compute_workload)(f) for f in faculty_list]
@@ -3,14 +3,30 @@ Person class for University Management System
 Implements the foundation for all person types in the university system.
 """
 
-from abc import ABC, abstractmethod
 from datetime import datetime
-import uuid
+from functools import lru_cache
+import re
+import secrets
 
 
-class Person(ABC):
+@lru_cache(maxsize=4096)
+def _canon(label):
+    """Canonicalize a label to stripped title case.
+
+    Majors and departments have tiny cardinality, so the cache turns
+    repeated title-casing during bulk ingestion into a hashed lookup.
+    """
+    return label.strip().title()
+
+
+class Person:
     """
-    Abstract base class representing a person in the university system.
+    Base class representing a person in the university system.
+
+    Not instantiated directly: subclasses must override get_role and
+    get_responsibilities. A plain class is used rather than abc.ABC
+    because ABCMeta adds measurable overhead to tiny-object construction
+    and isinstance checks, which matter on bulk loads.
     
     Attributes:
         person_id (str): Unique identifier for the person
@@ -20,7 +36,15 @@ class Person(ABC):
         date_of_birth (datetime): Date of birth
         address (str): Physical address
     """
-    
+
+    __slots__ = ('_person_id', '_name', '_email', '_phone', '_date_of_birth',
+                 '_address', '_created_at', '_created_at_str')
+
+    # Compiled once at class-definition time so bulk ingestion skips the
+    # re-module cache lookup on every validation
+    _EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+    _PHONE_RE = re.compile(r"^\d{3}-\d{4}$")
+
     def __init__(self, name, email, phone, date_of_birth=None, address=""):
         """
         Initialize a Person object.
@@ -32,14 +56,37 @@ class Person(ABC):
             date_of_birth (datetime, optional): Date of birth
             address (str, optional): Physical address
         """
-        self._person_id = str(uuid.uuid4())[:8]  # Generate unique ID
+        self._person_id = secrets.token_hex(4)  # Generate unique ID
         self._name = self._validate_name(name)
         self._email = self._validate_email(email)
-        self._phone = phone
+        self._phone = self._validate_phone(phone)
         self._date_of_birth = date_of_birth
         self._address = address
         self._created_at = datetime.now()
-    
+        # Formatted once here; creation time never changes, so
+        # get_basic_info reads a string field instead of calling strftime
+        self._created_at_str = self._created_at.strftime('%Y-%m-%d')
+
+    @classmethod
+    def from_trusted(cls, name, email, phone, date_of_birth=None, address=""):
+        """Construct without validation, for known-good bulk input.
+
+        Validation dominates construction time when loading thousands of
+        records from an already-validated source (CSV export, database
+        rehydrate); this skips the regex and string checks entirely.
+        Values are stored exactly as given.
+        """
+        obj = cls.__new__(cls)
+        obj._person_id = secrets.token_hex(4)
+        obj._name = name
+        obj._email = email
+        obj._phone = phone
+        obj._date_of_birth = date_of_birth
+        obj._address = address
+        obj._created_at = datetime.now()
+        obj._created_at_str = obj._created_at.strftime('%Y-%m-%d')
+        return obj
+
     # Property getters and setters for encapsulation
     @property
     def person_id(self):
@@ -73,8 +120,8 @@ class Person(ABC):
     
     @phone.setter
     def phone(self, value):
-        """Set phone number."""
-        self._phone = value
+        """Set phone number with validation."""
+        self._phone = self._validate_phone(value)
     
     @property
     def address(self):
@@ -91,26 +138,34 @@ class Person(ABC):
         """Validate name input."""
         if not name or not isinstance(name, str):
             raise ValueError("Name must be a non-empty string")
-        if len(name.strip()) < 2:
+        stripped = name.strip()
+        if len(stripped) < 2:
             raise ValueError("Name must be at least 2 characters long")
-        return name.strip().title()
+        return stripped.title()
     
     def _validate_email(self, email):
         """Basic email validation."""
-        if not email or "@" not in email or "." not in email:
+        if not email:
+            raise ValueError("Invalid email format")
+        email = email.strip().lower()
+        if not Person._EMAIL_RE.match(email):
             raise ValueError("Invalid email format")
-        return email.lower().strip()
+        return email
+
+    def _validate_phone(self, phone):
+        """Basic phone validation (555-0101 style)."""
+        if not phone or not Person._PHONE_RE.match(phone):
+            raise ValueError("Phone must use the 555-0101 format")
+        return phone
     
-    # Abstract methods to be implemented by subclasses
-    @abstractmethod
+    # Methods every subclass must override
     def get_responsibilities(self):
         """Get the responsibilities of this person type."""
-        pass
+        raise NotImplementedError
     
-    @abstractmethod
     def get_role(self):
         """Get the role/type of this person."""
-        pass
+        raise NotImplementedError
     
     def get_basic_info(self):
         """Get basic information about the person."""
@@ -119,9 +174,17 @@ class Person(ABC):
             'name': self.name,
             'email': self.email,
             'role': self.get_role(),
-            'created_at': self._created_at.strftime('%Y-%m-%d')
+            'created_at': self._created_at_str
         }
     
+    def get_basic_info_tuple(self):
+        """Get (role, name, person_id) without building a dict.
+
+        Fast path for display loops that only need these three fields;
+        get_basic_info remains the full dict-returning API.
+        """
+        return (self.get_role(), self._name, self._person_id)
+    
     def __str__(self):
         """String representation of the person."""
         return f"{self.get_role()}: {self.name} (ID: {self.person_id})"
@@ -142,7 +205,9 @@ class Staff(Person):
         salary (float): Annual salary
         hire_date (datetime): Date of hiring
     """
-    
+
+    __slots__ = ('_staff_id', '_department', '_position', '_salary', '_hire_date')
+
     def __init__(self, name, email, phone, department, position, salary=0.0, **kwargs):
         """
         Initialize a Staff object.
@@ -163,6 +228,18 @@ class Staff(Person):
         self._salary = self._validate_salary(salary)
         self._hire_date = datetime.now()
     
+    @classmethod
+    def from_trusted(cls, name, email, phone, department, position, salary=0.0,
+                     **kwargs):
+        """Construct without validation, for known-good bulk input."""
+        obj = super().from_trusted(name, email, phone, **kwargs)
+        obj._staff_id = f"STF{obj._person_id}"
+        obj._department = department
+        obj._position = position
+        obj._salary = float(salary)
+        obj._hire_date = datetime.now()
+        return obj
+
     @property
     def staff_id(self):
         """Get staff ID (read-only)."""
@@ -3,10 +3,101 @@ Student classes for University Management System
 Implements Student hierarchy with course enrollment and GPA tracking.
 """
 
-from person import Person
+from person import Person, _canon
+from bisect import bisect_right
+from collections import deque
 from datetime import datetime
+from functools import lru_cache
+from types import SimpleNamespace
+import logging
+import time
 from typing import List, Dict, Optional
 
+# Optional accelerators for batch GPA analytics
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+logger = logging.getLogger(__name__)
+
+_VALID_CLASS_YEARS = frozenset({"Freshman", "Sophomore", "Junior", "Senior"})
+
+# Most recent access-log entries retained per SecureStudentRecord
+_ACCESS_LOG_LIMIT = 1024
+
+# Academic-status thresholds; bisect_right on the GPA indexes the status
+_GPA_THRESHOLDS = (1.0, 2.0, 3.5)
+_STATUSES = ("Academic Suspension", "Academic Probation", "Good Standing", "Dean's List")
+
+# Graduation requirements never vary per instance, so share one frozen
+# record per program instead of allocating a dict per student
+_UG_REQUIREMENTS = SimpleNamespace(min_credits=120, min_gpa=2.0, major_credits=36)
+_MASTERS_REQUIREMENTS = SimpleNamespace(min_credits=36, min_gpa=3.0, research_credits=6)
+_PHD_REQUIREMENTS = SimpleNamespace(min_credits=72, min_gpa=3.0, research_credits=24)
+
+
+def _gpa_kernel(grades, credits):
+    """Weighted-average GPA over parallel grade/credit arrays.
+
+    Ungraded entries are encoded as grade -1.0 and skipped. Compiled with
+    Numba when it is available; otherwise runs as plain Python.
+    """
+    total_points = 0.0
+    total_credits = 0
+    for i in range(grades.shape[0]):
+        if grades[i] >= 0.0:
+            total_points += grades[i] * credits[i]
+            total_credits += credits[i]
+    return total_points / total_credits if total_credits else 0.0
+
+
+if njit is not None:
+    _gpa_kernel = njit(cache=True)(_gpa_kernel)
+
+
+def compute_gpas(students: List['Student']) -> List[float]:
+    """
+    Compute GPAs for a batch of students using the numeric kernel.
+
+    Exports each student's courses as structure-of-arrays NumPy buffers and
+    reduces them in _gpa_kernel, avoiding per-course dict lookups. Intended
+    for department-wide analytics; single-student callers should keep using
+    Student.calculate_gpa.
+
+    Args:
+        students (list): Student objects to compute GPAs for
+
+    Returns:
+        list: GPA per student, rounded to two decimals
+    """
+    return [
+        round(float(_gpa_kernel(*student._to_arrays())), 2)
+        for student in students
+    ]
+
+
+@lru_cache(maxsize=1)
+def _semester_for(year: int, month: int) -> str:
+    """Format the semester identifier for a given year and month."""
+    if month >= 8:
+        return f"Fall {year}"
+    elif month >= 5:
+        return f"Summer {year}"
+    else:
+        return f"Spring {year}"
+
+
+# Flyweight pool: one Course object per (code, definition) for the whole
+# process, shared by every demo and department that references the code
+_COURSE_POOL: Dict[str, 'Course'] = {}
+
 
 class Course:
     """
@@ -19,21 +110,94 @@ class Course:
         prerequisites (list): List of prerequisite course codes
         max_enrollment (int): Maximum number of students
     """
-    
+
+    __slots__ = ('course_code', 'course_name', 'credits', 'prerequisites',
+                 'max_enrollment', 'enrolled_students', 'instructor',
+                 'is_research', '_prereq_closure')
+
     def __init__(self, course_code, course_name, credits, prerequisites=None, max_enrollment=30):
         """Initialize a Course object."""
         self.course_code = course_code
         self.course_name = course_name
         self.credits = credits
-        self.prerequisites = prerequisites or []
+        self.prerequisites = tuple(prerequisites) if prerequisites else ()
         self.max_enrollment = max_enrollment
-        self.enrolled_students = []
+        self.enrolled_students = set()
         self.instructor = None
-    
+        self.is_research = 'Research' in course_name
+        self._prereq_closure = None  # set by compute_prereq_closures
+
+    @classmethod
+    def get_or_create(cls, course_code, course_name, credits, prerequisites=None, max_enrollment=30):
+        """Return the pooled Course for this definition, constructing once.
+
+        Re-creating the same course in several demos allocated a fresh
+        object each time; the pool hands back the existing instance when
+        the definition matches and replaces it when it differs.
+        """
+        pooled = _COURSE_POOL.get(course_code)
+        prereqs = tuple(prerequisites) if prerequisites else ()
+        if (pooled is not None and pooled.course_name == course_name
+                and pooled.credits == credits
+                and pooled.prerequisites == prereqs
+                and pooled.max_enrollment == max_enrollment):
+            return pooled
+
+        course = cls(course_code, course_name, credits, prerequisites, max_enrollment)
+        _COURSE_POOL[course_code] = course
+        return course
+
     def __str__(self):
         return f"{self.course_code}: {self.course_name} ({self.credits} credits)"
 
 
+def compute_prereq_closures(courses: Dict[str, 'Course']):
+    """
+    Precompute each course's transitive prerequisite closure.
+
+    Runs Kahn's topological sort over the prerequisite DAG and stores the
+    full set of direct and indirect prerequisites on each Course as a
+    frozenset, so enrollment validation becomes a single subset test
+    instead of a repeated graph walk.
+
+    Args:
+        courses (dict): Mapping of course codes to Course objects
+
+    Raises:
+        ValueError: If the prerequisite graph contains a cycle
+    """
+    in_degree = {}
+    dependents = {code: [] for code in courses}
+
+    for code, course in courses.items():
+        known_prereqs = [p for p in course.prerequisites if p in courses]
+        in_degree[code] = len(known_prereqs)
+        for prereq in known_prereqs:
+            dependents[prereq].append(code)
+
+    queue = deque(code for code, degree in in_degree.items() if degree == 0)
+    processed = 0
+
+    while queue:
+        code = queue.popleft()
+        processed += 1
+
+        course = courses[code]
+        closure = set(course.prerequisites)
+        for prereq in course.prerequisites:
+            if prereq in courses:
+                closure |= courses[prereq]._prereq_closure
+        course._prereq_closure = frozenset(closure)
+
+        for dependent in dependents[code]:
+            in_degree[dependent] -= 1
+            if in_degree[dependent] == 0:
+                queue.append(dependent)
+
+    if processed != len(courses):
+        raise ValueError("Prerequisite graph contains a cycle")
+
+
 class Student(Person):
     """
     Base Student class with enrollment and GPA tracking capabilities.
@@ -46,7 +210,12 @@ class Student(Person):
         gpa_history (list): GPA history by semester
         academic_status (str): Current academic standing
     """
-    
+
+    __slots__ = ('_student_id', '_major', '_enrollment_date', '_enrolled_courses',
+                 '_gpa_history', '_academic_status', '_total_credits',
+                 '_grade_point_sum', '_graded_credits', '_semester_points',
+                 '_completed_courses')
+
     def __init__(self, name, email, phone, major, **kwargs):
         """
         Initialize a Student object.
@@ -62,10 +231,14 @@ class Student(Person):
         self._student_id = f"STU{self.person_id}"
         self._major = self._validate_major(major)
         self._enrollment_date = datetime.now()
-        self._enrolled_courses = {}  # {course_code: {'course': Course, 'grade': float, 'semester': str}}
-        self._gpa_history = []  # [{'semester': str, 'gpa': float, 'credits': int}]
+        self._enrolled_courses = {}  # {course_code: transcript row dict + 'course' back-reference}
+        self._gpa_history = {}  # {semester: {'semester': str, 'gpa': float, 'credits': int}}
         self._academic_status = "Good Standing"
         self._total_credits = 0
+        self._grade_point_sum = 0.0
+        self._graded_credits = 0
+        self._semester_points = {}  # {semester: [grade_points, graded_credits]}
+        self._completed_courses = set()  # course codes passed with grade >= 2.0
     
     # Properties with validation
     @property
@@ -97,7 +270,7 @@ class Student(Person):
         """Validate major input."""
         if not major or not isinstance(major, str):
             raise ValueError("Major must be a non-empty string")
-        return major.strip().title()
+        return _canon(major)
     
     def _validate_grade(self, grade):
         """Validate grade input (0.0-4.0 scale)."""
@@ -120,39 +293,89 @@ class Student(Person):
         Returns:
             bool: True if enrollment successful, False otherwise
         """
-        try:
-            # Check if already enrolled
-            if course.course_code in self._enrolled_courses:
-                print(f"Already enrolled in {course.course_code}")
-                return False
-            
-            # Check enrollment limits
-            if len(course.enrolled_students) >= course.max_enrollment:
-                print(f"Course {course.course_code} is full")
-                return False
-            
-            # Check prerequisites
-            if not self._check_prerequisites(course.prerequisites):
-                print(f"Prerequisites not met for {course.course_code}")
-                return False
-            
-            # Enroll student
-            semester = semester or self._get_current_semester()
-            self._enrolled_courses[course.course_code] = {
-                'course': course,
-                'grade': None,
-                'semester': semester,
-                'status': 'Enrolled'
-            }
-            
-            course.enrolled_students.append(self.student_id)
-            print(f"Successfully enrolled in {course.course_code}")
-            return True
-            
-        except Exception as e:
-            print(f"Enrollment failed: {e}")
+        # Check if already enrolled
+        if course.course_code in self._enrolled_courses:
+            logger.info("Already enrolled in %s", course.course_code)
+            return False
+
+        # Check enrollment limits
+        if len(course.enrolled_students) >= course.max_enrollment:
+            logger.info("Course %s is full", course.course_code)
             return False
+
+        # Check prerequisites; foundation courses carry a shared empty
+        # tuple, so the truthiness test skips the validation entirely
+        if course.prerequisites and not self._check_prerequisites(course):
+            logger.info("Prerequisites not met for %s", course.course_code)
+            return False
+
+        # Enroll student; the row already carries its transcript fields
+        semester = semester or self._get_current_semester()
+        self._enrolled_courses[course.course_code] = {
+            'course': course,
+            'course_name': course.course_name,
+            'credits': course.credits,
+            'grade': None,
+            'semester': semester,
+            'status': 'Enrolled'
+        }
+
+        course.enrolled_students.add(self.student_id)
+        if course.instructor is not None:
+            course.instructor.on_enrollment_change(1)
+        logger.info("Successfully enrolled in %s", course.course_code)
+        return True
     
+    def enroll_courses(self, courses, semester: str = None) -> List[bool]:
+        """
+        Enroll student in several courses as one batch.
+
+        Resolves the semester once for the whole batch and buffers all
+        status messages into a single log record, so enrolling a full
+        schedule avoids the per-call overhead of enroll_course.
+
+        Args:
+            courses (iterable): Course objects to enroll in
+            semester (str, optional): Semester identifier for the batch
+
+        Returns:
+            list: Per-course success flags, in input order
+        """
+        semester = semester or self._get_current_semester()
+        results = []
+        messages = []
+
+        for course in courses:
+            code = course.course_code
+            if code in self._enrolled_courses:
+                messages.append(f"Already enrolled in {code}")
+                results.append(False)
+            elif len(course.enrolled_students) >= course.max_enrollment:
+                messages.append(f"Course {code} is full")
+                results.append(False)
+            elif course.prerequisites and not self._check_prerequisites(course):
+                messages.append(f"Prerequisites not met for {code}")
+                results.append(False)
+            else:
+                self._enrolled_courses[code] = {
+                    'course': course,
+                    'course_name': course.course_name,
+                    'credits': course.credits,
+                    'grade': None,
+                    'semester': semester,
+                    'status': 'Enrolled'
+                }
+                course.enrolled_students.add(self.student_id)
+                if course.instructor is not None:
+                    course.instructor.on_enrollment_change(1)
+                messages.append(f"Successfully enrolled in {code}")
+                results.append(True)
+
+        if messages:
+            logger.info('\n'.join(messages))
+
+        return results
+
     def drop_course(self, course_code: str) -> bool:
         """
         Drop a course.
@@ -163,25 +386,25 @@ class Student(Person):
         Returns:
             bool: True if drop successful, False otherwise
         """
-        try:
-            if course_code not in self._enrolled_courses:
-                print(f"Not enrolled in course {course_code}")
-                return False
-            
-            # Remove from enrolled courses
-            course = self._enrolled_courses[course_code]['course']
-            del self._enrolled_courses[course_code]
-            
-            # Remove from course enrollment list
-            if self.student_id in course.enrolled_students:
-                course.enrolled_students.remove(self.student_id)
-            
-            print(f"Successfully dropped {course_code}")
-            return True
-            
-        except Exception as e:
-            print(f"Drop failed: {e}")
+        course_info = self._enrolled_courses.pop(course_code, None)
+        if course_info is None:
+            logger.info("Not enrolled in course %s", course_code)
             return False
+
+        course = course_info['course']
+        if course_info['grade'] is not None:
+            self._remove_grade_contribution(
+                course_info['grade'], course.credits, course_info['semester']
+            )
+        self._completed_courses.discard(course_code)
+
+        # Remove from course enrollment set
+        course.enrolled_students.discard(self.student_id)
+        if course.instructor is not None:
+            course.instructor.on_enrollment_change(-1)
+
+        logger.info("Successfully dropped %s", course_code)
+        return True
     
     def add_grade(self, course_code: str, grade: float) -> bool:
         """
@@ -194,25 +417,64 @@ class Student(Person):
         Returns:
             bool: True if grade added successfully
         """
+        course_info = self._enrolled_courses.get(course_code)
+        if course_info is None:
+            logger.info("Not enrolled in course %s", course_code)
+            return False
+
+        # Only the validator can raise; keep the bool contract for callers
         try:
-            if course_code not in self._enrolled_courses:
-                print(f"Not enrolled in course {course_code}")
-                return False
-            
             validated_grade = self._validate_grade(grade)
-            self._enrolled_courses[course_code]['grade'] = validated_grade
-            self._enrolled_courses[course_code]['status'] = 'Completed'
-            
+        except ValueError:
+            logger.exception("Adding grade failed")
+            return False
+
+        course = course_info['course']
+
+        # If regrading, remove the previous contribution first
+        if course_info['grade'] is not None:
+            self._remove_grade_contribution(
+                course_info['grade'], course.credits, course_info['semester']
+            )
+        else:
             # Add credits to total
-            course = self._enrolled_courses[course_code]['course']
             self._total_credits += course.credits
-            
-            print(f"Grade {validated_grade} added for {course_code}")
-            return True
-            
-        except Exception as e:
-            print(f"Adding grade failed: {e}")
-            return False
+
+        course_info['grade'] = validated_grade
+        course_info['status'] = 'Completed'
+
+        # Update running GPA aggregates incrementally
+        self._grade_point_sum += validated_grade * course.credits
+        self._graded_credits += course.credits
+        semester_totals = self._semester_points.setdefault(course_info['semester'], [0.0, 0])
+        semester_totals[0] += validated_grade * course.credits
+        semester_totals[1] += course.credits
+
+        # Keep the passed-course set in sync for prerequisite checks
+        if validated_grade >= 2.0:
+            self._completed_courses.add(course_code)
+        else:
+            self._completed_courses.discard(course_code)
+
+        logger.info("Grade %s added for %s", validated_grade, course_code)
+        return True
+    
+    def add_grades(self, grade_map: Dict[str, float]) -> Dict[str, bool]:
+        """
+        Record grades for several courses as one batch.
+
+        Companion to enroll_courses: the running GPA aggregates are
+        updated incrementally per grade, so the batch needs no final
+        recomputation pass.
+
+        Args:
+            grade_map (dict): Mapping of course codes to grades
+
+        Returns:
+            dict: Per-course success flags keyed by course code
+        """
+        return {code: self.add_grade(code, grade)
+                for code, grade in grade_map.items()}
     
     def calculate_gpa(self, semester: str = None) -> float:
         """
@@ -224,31 +486,51 @@ class Student(Person):
         Returns:
             float: Calculated GPA
         """
-        total_points = 0.0
-        total_credits = 0
-        
-        for course_info in self._enrolled_courses.values():
-            # Filter by semester if specified
-            if semester and course_info['semester'] != semester:
-                continue
-            
-            # Only count courses with grades
-            if course_info['grade'] is not None:
-                credits = course_info['course'].credits
-                grade = course_info['grade']
-                total_points += grade * credits
-                total_credits += credits
-        
-        if total_credits == 0:
+        # Semester GPA comes from the cached per-semester aggregates
+        if semester is not None:
+            total_points, total_credits = self._semester_points.get(semester, (0.0, 0))
+            if total_credits == 0:
+                return 0.0
+            return round(total_points / total_credits, 2)
+
+        # Overall GPA is an O(1) division over the running aggregates
+        if self._graded_credits == 0:
             return 0.0
-        
-        gpa = round(total_points / total_credits, 2)
-        
-        # Update GPA history if calculating overall GPA
-        if semester is None:
-            self._update_gpa_history(gpa, total_credits)
-        
+
+        gpa = round(self._grade_point_sum / self._graded_credits, 2)
+        self._update_gpa_history(gpa, self._graded_credits)
+
         return gpa
+
+    def _to_arrays(self):
+        """
+        Export enrolled courses as parallel NumPy arrays (SoA layout).
+
+        Returns:
+            tuple: (grades float32 array, credits int32 array); ungraded
+                courses are encoded as grade -1.0
+        """
+        if np is None:
+            raise ImportError("NumPy is required for array export")
+
+        count = len(self._enrolled_courses)
+        grades = np.empty(count, dtype=np.float32)
+        credits = np.empty(count, dtype=np.int32)
+
+        for i, info in enumerate(self._enrolled_courses.values()):
+            grades[i] = -1.0 if info['grade'] is None else info['grade']
+            credits[i] = info['course'].credits
+
+        return grades, credits
+
+    def _remove_grade_contribution(self, grade: float, credits: int, semester: str):
+        """Remove a graded course's contribution from the running GPA aggregates."""
+        self._grade_point_sum -= grade * credits
+        self._graded_credits -= credits
+        semester_totals = self._semester_points.get(semester)
+        if semester_totals:
+            semester_totals[0] -= grade * credits
+            semester_totals[1] -= credits
     
     def get_academic_status(self) -> str:
         """
@@ -257,79 +539,60 @@ class Student(Person):
         Returns:
             str: Academic status
         """
-        current_gpa = self.calculate_gpa()
-        
-        if current_gpa >= 3.5:
-            self._academic_status = "Dean's List"
-        elif current_gpa >= 2.0:
-            self._academic_status = "Good Standing"
-        elif current_gpa >= 1.0:
-            self._academic_status = "Academic Probation"
-        else:
-            self._academic_status = "Academic Suspension"
-        
+        self._academic_status = self._status_for_gpa(self.calculate_gpa())
         return self._academic_status
-    
-    def _check_prerequisites(self, prerequisites: List[str]) -> bool:
-        """Check if student has completed prerequisites."""
-        if not prerequisites:
-            return True
-        
-        completed_courses = [
-            code for code, info in self._enrolled_courses.items()
-            if info['grade'] is not None and info['grade'] >= 2.0
-        ]
-        
-        return all(prereq in completed_courses for prereq in prerequisites)
+
+    @staticmethod
+    def _status_for_gpa(gpa: float) -> str:
+        """Map a GPA to its academic status via the threshold table."""
+        return _STATUSES[bisect_right(_GPA_THRESHOLDS, gpa)]
+    
+    def _check_prerequisites(self, course: Course) -> bool:
+        """Check if student has completed a course's prerequisites."""
+        # Use the precomputed transitive closure when available, otherwise
+        # fall back to the course's direct prerequisite list
+        required = course._prereq_closure
+        if required is None:
+            required = course.prerequisites
+        return not required or self._completed_courses.issuperset(required)
     
     def _get_current_semester(self) -> str:
         """Get current semester identifier."""
         now = datetime.now()
-        year = now.year
-        if now.month >= 8:
-            return f"Fall {year}"
-        elif now.month >= 5:
-            return f"Summer {year}"
-        else:
-            return f"Spring {year}"
+        return _semester_for(now.year, now.month)
     
     def _update_gpa_history(self, gpa: float, credits: int):
         """Update GPA history."""
         current_semester = self._get_current_semester()
-        
-        # Update or add current semester GPA
-        for record in self._gpa_history:
-            if record['semester'] == current_semester:
-                record['gpa'] = gpa
-                record['credits'] = credits
-                return
-        
-        # Add new semester record
-        self._gpa_history.append({
+
+        # Update or add the current semester record with one keyed store
+        self._gpa_history[current_semester] = {
             'semester': current_semester,
             'gpa': gpa,
             'credits': credits
-        })
+        }
     
     def get_transcript(self) -> Dict:
         """Get student transcript information."""
+        # Compute the GPA once and derive the status from it directly
+        gpa = self.calculate_gpa()
+        self._academic_status = self._status_for_gpa(gpa)
+
+        # Rows are kept transcript-ready by enroll_course/add_grade/drop_course,
+        # so one shallow copy per course suffices
+        courses = {
+            code: {key: value for key, value in row.items() if key != 'course'}
+            for code, row in self._enrolled_courses.items()
+        }
+
         return {
             'student_info': self.get_basic_info(),
             'major': self.major,
             'total_credits': self.total_credits,
-            'current_gpa': self.calculate_gpa(),
-            'academic_status': self.get_academic_status(),
-            'courses': {
-                code: {
-                    'course_name': info['course'].course_name,
-                    'credits': info['course'].credits,
-                    'grade': info['grade'],
-                    'semester': info['semester'],
-                    'status': info['status']
-                }
-                for code, info in self._enrolled_courses.items()
-            },
-            'gpa_history': self._gpa_history
+            'current_gpa': gpa,
+            'academic_status': self._academic_status,
+            'courses': courses,
+            'gpa_history': list(self._gpa_history.values())
         }
     
     def get_responsibilities(self):
@@ -356,7 +619,10 @@ class UndergraduateStudent(Student):
         max_credits_per_semester (int): Maximum credits allowed per semester
         advisor (str): Academic advisor name
     """
-    
+
+    __slots__ = ('_class_year', '_max_credits_per_semester', '_advisor',
+                 '_graduation_requirements')
+
     def __init__(self, name, email, phone, major, class_year="Freshman", **kwargs):
         """Initialize UndergraduateStudent."""
         super().__init__(name, email, phone, major, **kwargs)
@@ -364,11 +630,7 @@ class UndergraduateStudent(Student):
         self._class_year = class_year
         self._max_credits_per_semester = 18
         self._advisor = None
-        self._graduation_requirements = {
-            'min_credits': 120,
-            'min_gpa': 2.0,
-            'major_credits': 36
-        }
+        self._graduation_requirements = _UG_REQUIREMENTS
     
     @property
     def class_year(self):
@@ -378,9 +640,8 @@ class UndergraduateStudent(Student):
     @class_year.setter
     def class_year(self, value):
         """Set class year with validation."""
-        valid_years = ["Freshman", "Sophomore", "Junior", "Senior"]
-        if value not in valid_years:
-            raise ValueError(f"Class year must be one of: {valid_years}")
+        if value not in _VALID_CLASS_YEARS:
+            raise ValueError(f"Class year must be one of: {sorted(_VALID_CLASS_YEARS)}")
         self._class_year = value
     
     def calculate_workload(self) -> int:
@@ -395,9 +656,10 @@ class UndergraduateStudent(Student):
     
     def can_graduate(self) -> bool:
         """Check if student meets graduation requirements."""
+        requirements = self._graduation_requirements
         return (
-            self.total_credits >= self._graduation_requirements['min_credits'] and
-            self.calculate_gpa() >= self._graduation_requirements['min_gpa']
+            self.total_credits >= requirements.min_credits and
+            self.calculate_gpa() >= requirements.min_gpa
         )
     
     def get_role(self):
@@ -415,7 +677,11 @@ class GraduateStudent(Student):
         thesis_topic (str): Research topic
         committee_members (list): Thesis committee members
     """
-    
+
+    __slots__ = ('_degree_type', '_thesis_advisor', '_thesis_topic',
+                 '_committee_members', '_research_credits',
+                 '_graduation_requirements')
+
     def __init__(self, name, email, phone, major, degree_type="Masters", **kwargs):
         """Initialize GraduateStudent."""
         super().__init__(name, email, phone, major, **kwargs)
@@ -428,17 +694,9 @@ class GraduateStudent(Student):
         
         # Different requirements based on degree type
         if degree_type == "PhD":
-            self._graduation_requirements = {
-                'min_credits': 72,
-                'min_gpa': 3.0,
-                'research_credits': 24
-            }
+            self._graduation_requirements = _PHD_REQUIREMENTS
         else:  # Masters
-            self._graduation_requirements = {
-                'min_credits': 36,
-                'min_gpa': 3.0,
-                'research_credits': 6
-            }
+            self._graduation_requirements = _MASTERS_REQUIREMENTS
     
     @property
     def degree_type(self):
@@ -457,18 +715,17 @@ class GraduateStudent(Student):
     
     def calculate_workload(self) -> Dict:
         """Calculate graduate student workload including research."""
-        coursework_credits = sum(
-            info['course'].credits
-            for info in self._enrolled_courses.values()
-            if 'Research' not in info['course'].course_name
-        )
-        
-        research_credits = sum(
-            info['course'].credits
-            for info in self._enrolled_courses.values()
-            if 'Research' in info['course'].course_name
-        )
-        
+        coursework_credits = 0
+        research_credits = 0
+
+        # Single pass; courses are tagged is_research at construction
+        for info in self._enrolled_courses.values():
+            course = info['course']
+            if course.is_research:
+                research_credits += course.credits
+            else:
+                coursework_credits += course.credits
+
         return {
             'coursework_credits': coursework_credits,
             'research_credits': research_credits,
@@ -478,10 +735,11 @@ class GraduateStudent(Student):
     def can_graduate(self) -> bool:
         """Check if graduate student meets graduation requirements."""
         workload = self.calculate_workload()
+        requirements = self._graduation_requirements
         return (
-            self.total_credits >= self._graduation_requirements['min_credits'] and
-            self.calculate_gpa() >= self._graduation_requirements['min_gpa'] and
-            workload['research_credits'] >= self._graduation_requirements['research_credits']
+            self.total_credits >= requirements.min_credits and
+            self.calculate_gpa() >= requirements.min_gpa and
+            workload['research_credits'] >= requirements.research_credits
         )
     
     def get_role(self):
@@ -507,7 +765,10 @@ class SecureStudentRecord:
     This class demonstrates encapsulation principles with strict data validation
     and controlled access to student information.
     """
-    
+
+    __slots__ = ('_student', '_log_ts', '_log_requester', '_log_action',
+                 '_locked', '_max_enrollment_limit')
+
     def __init__(self, student: Student):
         """
         Initialize secure student record.
@@ -519,7 +780,12 @@ class SecureStudentRecord:
             raise ValueError("Must provide a valid Student object")
         
         self._student = student
-        self._access_log = []
+        # Access log stored as parallel columns (SoA) to keep per-event
+        # overhead down to three appends; bounded ring buffers cap the
+        # audit trail at the most recent entries under sustained access
+        self._log_ts = deque(maxlen=_ACCESS_LOG_LIMIT)         # float timestamps
+        self._log_requester = deque(maxlen=_ACCESS_LOG_LIMIT)  # requester IDs
+        self._log_action = deque(maxlen=_ACCESS_LOG_LIMIT)     # action labels
         self._locked = False
         self._max_enrollment_limit = 20
     
@@ -551,27 +817,29 @@ class SecureStudentRecord:
         Returns:
             bool: True if enrollment successful
         """
-        try:
-            # Check enrollment limits
-            current_courses = len([
-                info for info in self._student._enrolled_courses.values()
-                if info['status'] == 'Enrolled'
-            ])
-            
-            if current_courses >= self._max_enrollment_limit:
-                raise ValueError(f"Cannot exceed {self._max_enrollment_limit} courses")
-            
-            # Check academic standing
-            if self._student.get_academic_status() == "Academic Suspension":
-                raise ValueError("Cannot enroll while on academic suspension")
-            
-            self._log_access(requester_id, f"course_enrollment_{course.course_code}")
-            return self._student.enroll_course(course, semester)
-            
-        except Exception as e:
-            self._log_access(requester_id, f"enrollment_failed_{e}")
-            print(f"Secure enrollment failed: {e}")
+        # One timestamp per public call, shared by every log entry below
+        now = time.time()
+
+        # Check enrollment limits
+        current_courses = sum(
+            1 for info in self._student._enrolled_courses.values()
+            if info['status'] == 'Enrolled'
+        )
+
+        if current_courses >= self._max_enrollment_limit:
+            self._log_access(requester_id, "enrollment_failed_course_limit", now)
+            logger.warning("Secure enrollment failed: cannot exceed %s courses",
+                           self._max_enrollment_limit)
+            return False
+
+        # Check academic standing
+        if self._student.get_academic_status() == "Academic Suspension":
+            self._log_access(requester_id, "enrollment_failed_suspension", now)
+            logger.warning("Secure enrollment failed: student is on academic suspension")
             return False
+
+        self._log_access(requester_id, f"course_enrollment_{course.course_code}", now)
+        return self._student.enroll_course(course, semester)
     
     def update_gpa_secure(self, course_code: str, grade: float, requester_id: str) -> bool:
         """
@@ -585,18 +853,16 @@ class SecureStudentRecord:
         Returns:
             bool: True if update successful
         """
-        try:
-            # Additional validation for grade changes
-            if grade < 0.0 or grade > 4.0:
-                raise ValueError("Grade must be between 0.0 and 4.0")
-            
-            self._log_access(requester_id, f"grade_update_{course_code}_{grade}")
-            return self._student.add_grade(course_code, grade)
-            
-        except Exception as e:
-            self._log_access(requester_id, f"grade_update_failed_{e}")
-            print(f"Secure grade update failed: {e}")
+        now = time.time()
+
+        # Additional validation for grade changes
+        if grade < 0.0 or grade > 4.0:
+            self._log_access(requester_id, "grade_update_failed_out_of_range", now)
+            logger.warning("Secure grade update failed: grade must be between 0.0 and 4.0")
             return False
+
+        self._log_access(requester_id, f"grade_update_{course_code}_{grade}", now)
+        return self._student.add_grade(course_code, grade)
     
     def lock_record(self, requester_id: str):
         """Lock the student record to prevent modifications."""
@@ -608,19 +874,29 @@ class SecureStudentRecord:
         self._locked = False
         self._log_access(requester_id, "record_unlocked")
     
-    def _log_access(self, requester_id: str, action: str):
-        """Log access to student record."""
-        self._access_log.append({
-            'timestamp': datetime.now(),
-            'requester_id': requester_id,
-            'action': action,
-            'student_id': self._student.student_id
-        })
-    
+    def _log_access(self, requester_id: str, action: str, ts: float = None):
+        """Log access to student record, reusing a caller-supplied timestamp."""
+        self._log_ts.append(ts if ts is not None else time.time())
+        self._log_requester.append(requester_id)
+        self._log_action.append(action)
+
     def get_access_log(self, requester_id: str) -> List[Dict]:
         """Get access log (administrative function)."""
         self._log_access(requester_id, "access_log_viewed")
-        return self._access_log.copy()
+
+        # Materialize per-event dicts only on demand
+        student_id = self._student.student_id
+        return [
+            {
+                'timestamp': datetime.fromtimestamp(ts),
+                'requester_id': requester,
+                'action': action,
+                'student_id': student_id
+            }
+            for ts, requester, action in zip(
+                self._log_ts, self._log_requester, self._log_action
+            )
+        ]
     
     @property
     def is_locked(self) -> bool:
